@@ -0,0 +1,32 @@
+"""default_last_message_at_in_database
+
+Revision ID: 3b9e1c7a5d20
+Revises: f8afd683b329
+Create Date: 2026-10-15 22:45:10.412873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e1c7a5d20'
+down_revision: Union[str, None] = 'f8afd683b329'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('conversations', 'last_message_at',
+               existing_type=sa.DateTime(),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column('conversations', 'last_message_at',
+               existing_type=sa.DateTime(),
+               server_default=None,
+               existing_nullable=True)
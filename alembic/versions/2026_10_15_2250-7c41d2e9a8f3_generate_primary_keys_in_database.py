@@ -0,0 +1,40 @@
+"""generate_primary_keys_in_database
+
+Revision ID: 7c41d2e9a8f3
+Revises: 3b9e1c7a5d20
+Create Date: 2026-10-15 22:50:37.218405
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41d2e9a8f3'
+down_revision: Union[str, None] = '3b9e1c7a5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('roles', 'users', 'user_roles', 'conversations')
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; older servers need pgcrypto
+    if op.get_bind().dialect.server_version_info < (13,):
+        op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+
+    for table in TABLES:
+        op.alter_column(table, 'id',
+                   existing_type=sa.UUID(),
+                   server_default=sa.text('gen_random_uuid()'),
+                   existing_nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id',
+                   existing_type=sa.UUID(),
+                   server_default=None,
+                   existing_nullable=False)
@@ -0,0 +1,32 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: a5f08b6e2c17
+Revises: 7c41d2e9a8f3
+Create Date: 2026-10-15 22:55:02.904116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5f08b6e2c17'
+down_revision: Union[str, None] = '7c41d2e9a8f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_roles_id'), table_name='roles')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_user_roles_id'), table_name='user_roles')
+    op.drop_index(op.f('ix_conversations_id'), table_name='conversations')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_conversations_id'), 'conversations', ['id'], unique=False)
+    op.create_index(op.f('ix_user_roles_id'), 'user_roles', ['id'], unique=False)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_roles_id'), 'roles', ['id'], unique=False)
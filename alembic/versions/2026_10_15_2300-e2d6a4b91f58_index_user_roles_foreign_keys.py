@@ -0,0 +1,28 @@
+"""index_user_roles_foreign_keys
+
+Revision ID: e2d6a4b91f58
+Revises: a5f08b6e2c17
+Create Date: 2026-10-15 23:00:18.550392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d6a4b91f58'
+down_revision: Union[str, None] = 'a5f08b6e2c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_user_roles_user_id_role_id', 'user_roles', ['user_id', 'role_id'], unique=True)
+    op.create_index(op.f('ix_user_roles_role_id'), 'user_roles', ['role_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_roles_role_id'), table_name='user_roles')
+    op.drop_index('ix_user_roles_user_id_role_id', table_name='user_roles')
@@ -0,0 +1,43 @@
+"""unique_active_conversation_per_sender
+
+Revision ID: 5d8c3f1e6b94
+Revises: e2d6a4b91f58
+Create Date: 2026-10-15 23:05:44.671930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8c3f1e6b94'
+down_revision: Union[str, None] = 'e2d6a4b91f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recent active conversation per sender so the
+    # unique index can be built
+    op.execute("""
+        UPDATE conversations SET is_active = false
+        WHERE is_active AND id NOT IN (
+            SELECT DISTINCT ON (sender_id) id FROM conversations
+            WHERE is_active
+            ORDER BY sender_id, created_at DESC
+        )
+    """)
+
+    # Build without locking out inbound messages
+    with op.get_context().autocommit_block():
+        op.create_index('ix_conversations_active_sender_id', 'conversations', ['sender_id'],
+                        unique=True, postgresql_where=sa.text('is_active'),
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_conversations_active_sender_id', table_name='conversations',
+                      postgresql_concurrently=True, if_exists=True)
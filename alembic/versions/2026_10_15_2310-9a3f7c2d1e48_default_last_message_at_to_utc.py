@@ -0,0 +1,33 @@
+"""default_last_message_at_to_utc
+
+Revision ID: 9a3f7c2d1e48
+Revises: 5d8c3f1e6b94
+Create Date: 2026-10-15 23:10:21.538104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f7c2d1e48'
+down_revision: Union[str, None] = '5d8c3f1e6b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Naive column, so pin the default to UTC rather than the session time zone
+    op.alter_column('conversations', 'last_message_at',
+               existing_type=sa.DateTime(),
+               server_default=sa.text("timezone('utc', now())"),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column('conversations', 'last_message_at',
+               existing_type=sa.DateTime(),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
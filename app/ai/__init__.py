@@ -1,6 +1,11 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict
 
+# Long string kwargs are cut to _TRUNC chars once they exceed _THRESH
+_TRUNC = 47
+_THRESH = 50
+
 
 class AILogger:
     """
@@ -9,84 +14,145 @@ class AILogger:
     Provides structured logging with visual indicators for different AI operations.
     """
 
+    # Rich markup around kwargs is opt-in; toggled from settings in setup_logging
+    use_rich_markup: bool = False
+
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.module_name = name.split('.')[-1].upper()
+        self._prefix = f"[{self.module_name}]"
+        # Per-level prefixes so each call is a plain concatenation
+        prefix = self._prefix + " "
+        self._info_prefix = "✅ " + prefix
+        self._debug_prefix = "⚙️  " + prefix
+        self._warning_prefix = "⚠️  " + prefix
+        self._error_prefix = "❌ " + prefix
+        self._success_prefix = "🎉 " + prefix
+        self._processing_prefix = "🔄 " + prefix
+        self._storage_prefix = "💾 " + prefix
+        self._workflow_prefix = "🔀 " + prefix
+        self._ai_operation_prefix = "🧠 " + prefix
 
     def info(self, message: str, **kwargs):
         """Log info message with green color and checkmark."""
-        formatted_msg = f"✅ [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._info_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._info_prefix + message)
 
     def debug(self, message: str, **kwargs):
         """Log debug message with yellow color and gear emoji."""
-        formatted_msg = f"⚙️  [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.debug(formatted_msg)
+            self.logger.debug(
+                self._debug_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.debug(self._debug_prefix + message)
 
     def warning(self, message: str, **kwargs):
         """Log warning message with orange color and warning emoji."""
-        formatted_msg = f"⚠️  [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.warning(formatted_msg)
+            self.logger.warning(
+                self._warning_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.warning(self._warning_prefix + message)
 
     def error(self, message: str, **kwargs):
         """Log error message with red color and error emoji."""
-        formatted_msg = f"❌ [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.error(formatted_msg)
+            self.logger.error(
+                self._error_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.error(self._error_prefix + message)
 
     def success(self, message: str, **kwargs):
         """Log success message with green color and celebration emoji."""
-        formatted_msg = f"🎉 [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._success_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._success_prefix + message)
 
     def processing(self, message: str, **kwargs):
         """Log processing message with blue color and processing emoji."""
-        formatted_msg = f"🔄 [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._processing_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._processing_prefix + message)
 
     def storage(self, message: str, **kwargs):
         """Log storage operation with database emoji."""
-        formatted_msg = f"💾 [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._storage_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._storage_prefix + message)
 
     def workflow(self, message: str, **kwargs):
         """Log workflow operation with workflow emoji."""
-        formatted_msg = f"🔀 [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._workflow_prefix + message + " | " + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._workflow_prefix + message)
 
     def ai_operation(self, message: str, **kwargs):
         """Log AI operation with brain emoji."""
-        formatted_msg = f"🧠 [{self.module_name}] {message}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if kwargs:
-            formatted_msg += f" | {self._format_kwargs(kwargs)}"
-        self.logger.info(formatted_msg)
+            self.logger.info(
+                self._ai_operation_prefix
+                + message
+                + " | "
+                + self._format_kwargs(kwargs)
+            )
+        else:
+            self.logger.info(self._ai_operation_prefix + message)
 
     def _format_kwargs(self, kwargs: Dict[str, Any]) -> str:
         """Format keyword arguments for logging."""
-        formatted_parts = []
-        for key, value in kwargs.items():
-            if isinstance(value, str) and len(value) > 50:
-                value = f"{value[:47]}..."
-            formatted_parts.append(
-                f"[cyan]{key}[/cyan]=[magenta]{value}[/magenta]")
-        return " ".join(formatted_parts)
-
-
+        if self.use_rich_markup:
+            fmt = "[cyan]{}[/cyan]=[magenta]{}[/magenta]"
+        else:
+            fmt = "{}={}"
+        return " ".join(
+            fmt.format(
+                key,
+                value[:_TRUNC] + "..."
+                if type(value) is str and len(value) > _THRESH
+                else value,
+            )
+            for key, value in kwargs.items()
+        )
+
+
+@lru_cache(maxsize=None)
 def get_ai_logger(name: str) -> AILogger:
     """
     Get an enhanced AI logger instance.
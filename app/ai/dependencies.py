@@ -1,11 +1,20 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import Depends
 from app.ai.services.chat_service import ChatService
 
+# Global ChatService instance so its compiled workflow cache is shared
+_chat_service: Optional[ChatService] = None
+
+
 def get_chat_service(
 ) -> ChatService:
     """Get ChatService instance with dependencies."""
-    return ChatService()
+    global _chat_service
+
+    if _chat_service is None:
+        _chat_service = ChatService()
+
+    return _chat_service
 
 
 # Type aliases for clean injection
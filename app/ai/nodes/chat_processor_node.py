@@ -1,14 +1,36 @@
+from functools import lru_cache
 from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
 from app.core.config import settings
+from typing import Any, Dict
 from app.ai.schemas.workflow_states import ChatState
 from app.ai.prompts.prompts import SYSTEM_PROMPT
 import logging
 
 logger = logging.getLogger(__name__)
 
+# System prompt prefix shared by every LLM call
+_SYSTEM_MESSAGES = (SystemMessage(content=SYSTEM_PROMPT),)
 
-def chat_processor_node(state: ChatState) -> ChatState:
+# Bound each LLM call so a stalled request fails instead of holding a worker
+_LLM_TIMEOUT_SECONDS = 30
+_LLM_MAX_RETRIES = 2
+
+
+@lru_cache(maxsize=4)
+def _get_llm(model: str) -> ChatOpenAI:
+    """
+    Get a cached ChatOpenAI client for the given model.
+
+    Reusing the client keeps its underlying HTTP connection pool alive
+    across invocations instead of rebuilding it for every message.
+    """
+    return ChatOpenAI(
+        model=model, timeout=_LLM_TIMEOUT_SECONDS, max_retries=_LLM_MAX_RETRIES
+    )
+
+
+async def chat_processor_node(state: ChatState) -> Dict[str, Any]:
     """
     Node that processes chat messages using OpenAI's language model with context limiting.
 
@@ -26,7 +48,8 @@ def chat_processor_node(state: ChatState) -> ChatState:
             - Other state properties as defined in ChatState schema
 
     Returns:
-        ChatState: Updated chat state with the AI response appended to messages list
+        Dict[str, Any]: State update with the AI response for the add_messages
+        reducer to append to the messages list
 
     Raises:
         Exception: If OpenAI API call fails or other processing errors occur
@@ -36,31 +59,20 @@ def chat_processor_node(state: ChatState) -> ChatState:
         hallucinations.The full conversation history is preserved in the state, but only recent
         messages are sent to the LLM for context.
     """
-    logger.info(f"[CHAT_PROCESSOR_NODE] Started processing chat message")
-    llm = ChatOpenAI(model=settings.OPENAI_MODEL)
-    system_message = [SystemMessage(content=(SYSTEM_PROMPT))]
-
-    # Limit conversation history to prevent token overflow and hallucinations
-    max_messages = settings.MAX_MESSAGES_IN_CONTEXT
-    if len(state.messages) > max_messages:
-        # Keep only the last N messages to maintain recent context
-        recent_messages = state.messages[-max_messages:]
-        logger.info(
-            f"[CHAT_PROCESSOR_NODE] Limited message history from {len(state.messages)} to {len(recent_messages)} messages"
-        )
-    else:
-        recent_messages = state.messages
-        logger.info(
-            f"[CHAT_PROCESSOR_NODE] Using all {len(state.messages)} messages (within limit)"
-        )
-
-    input_messages = system_message + recent_messages
+    llm = _get_llm(settings.OPENAI_MODEL)
+
+    # Limit conversation history to prevent token overflow and hallucinations.
+    # Slicing past the start of a short history simply yields all messages.
+    input_messages = [
+        *_SYSTEM_MESSAGES,
+        *state["messages"][-settings.MAX_MESSAGES_IN_CONTEXT :],
+    ]
+    response = await llm.ainvoke(input_messages)
     logger.info(
-        f"[CHAT_PROCESSOR_NODE] Input message given to LLM: {input_messages[-1].content}"
+        "[CHAT_PROCESSOR_NODE] LLM call: input=%s response=%s",
+        input_messages[-1].content,
+        response.content,
     )
-    response = llm.invoke(input_messages)
-    logger.info(f"[CHAT_PROCESSOR_NODE] Response from LLM: {response.content}")
 
-    # Add the AI response to the messages
-    state.messages.append(response)
-    return state
+    # Return only the AI response; the add_messages reducer appends it
+    return {"messages": [response]}
@@ -1,24 +1,46 @@
-import os
-from typing import BinaryIO
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict
 from langchain_core.messages import HumanMessage
 from app.schemas.chat import Audio
 from app.ai.schemas.workflow_states import ChatState
-from openai import OpenAI
-from app.ai.nodes.shared import download_file_from_facebook
+from openai import AsyncOpenAI
+from app.ai.nodes.shared import download_file_to_memory
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Transcription of long voice notes can take a while, but never indefinitely
+_TRANSCRIPTION_TIMEOUT_SECONDS = 60
+_TRANSCRIPTION_MAX_RETRIES = 2
 
-def transcribe_audio_file(audio_file: BinaryIO) -> str:
+
+@lru_cache(maxsize=1)
+def _get_openai() -> AsyncOpenAI:
+    """
+    Get a cached async OpenAI client shared by all transcription calls.
+
+    Reusing the client keeps its underlying HTTP connection pool alive
+    across invocations instead of rebuilding it for every audio message.
+    """
+    return AsyncOpenAI(
+        timeout=_TRANSCRIPTION_TIMEOUT_SECONDS,
+        max_retries=_TRANSCRIPTION_MAX_RETRIES,
+    )
+
+
+async def transcribe_audio_file(
+    audio_file: BinaryIO | tuple[str, BinaryIO, str],
+) -> str:
     """
     Transcribe an audio file using OpenAI's Whisper model.
 
-    This function takes a binary audio file and uses OpenAI's Whisper-1 model
+    This function takes an audio file and uses OpenAI's Whisper-1 model
     to transcribe the audio content into text.
 
     Args:
-        audio_file (BinaryIO): Binary audio file object to be transcribed
+        audio_file (BinaryIO | tuple[str, BinaryIO, str]): Audio file to be
+            transcribed, either a binary file object or a
+            (filename, file object, mime_type) tuple
 
     Returns:
         str: Transcribed text from the audio file, or error message if no file provided
@@ -29,9 +51,8 @@ def transcribe_audio_file(audio_file: BinaryIO) -> str:
     if not audio_file:
         return "No audio file provided"
     try:
-        logger.info(f"[HANDLE_AUDIO_NODE] Starting transcribing audio file")
-        llm = OpenAI()
-        transcription = llm.audio.transcriptions.create(
+        llm = _get_openai()
+        transcription = await llm.audio.transcriptions.create(
             file=audio_file, model="whisper-1", response_format="text"
         )
         return transcription
@@ -39,12 +60,13 @@ def transcribe_audio_file(audio_file: BinaryIO) -> str:
         raise ValueError("Error transcribing audio") from e
 
 
-def transcribe_audio(audio: Audio) -> str:
+async def transcribe_audio(audio: Audio) -> str:
     """
     Download and transcribe an audio message from WhatsApp.
 
-    This function downloads an audio file from Facebook's servers using the audio ID,
-    transcribes it using OpenAI's Whisper model, and cleans up the temporary file.
+    This function downloads an audio file from Facebook's servers using the audio ID
+    into memory and transcribes it using OpenAI's Whisper model. The audio never
+    touches the local filesystem.
 
     Args:
         audio (Audio): Audio object containing:
@@ -57,22 +79,20 @@ def transcribe_audio(audio: Audio) -> str:
     Raises:
         ValueError: If download or transcription fails
     """
-    logger.info(f"[HANDLE_AUDIO_NODE] Downloading audio file from Facebook")
-    file_path = download_file_from_facebook(audio.id, "audio", audio.mime_type)
-    logger.info(f"[HANDLE_AUDIO_NODE] Downloaded audio file path: {file_path}")
-    with open(file_path, "rb") as audio_binary:
-        transcription = transcribe_audio_file(audio_binary)
-    try:
-        os.remove(file_path)
-        logger.info(
-            f"[HANDLE_AUDIO_NODE] Audio file transcribed and deleted successfully"
-        )
-    except Exception as e:
-        logger.error(f"[HANDLE_AUDIO_NODE] Failed to delete audio file: {e}")
+    audio_buffer = await download_file_to_memory(audio.id, audio.mime_type)
+    transcription = await transcribe_audio_file(
+        (audio_buffer.name, audio_buffer, audio.mime_type)
+    )
+    logger.info(
+        "[HANDLE_AUDIO_NODE] Audio pipeline: downloaded=%s size=%d transcribed=%d",
+        audio_buffer.name,
+        audio_buffer.getbuffer().nbytes,
+        len(transcription),
+    )
     return transcription
 
 
-def handle_audio_node(state: ChatState) -> ChatState:
+async def handle_audio_node(state: ChatState) -> Dict[str, Any]:
     """
     Workflow node that processes audio messages from WhatsApp.
 
@@ -83,25 +103,19 @@ def handle_audio_node(state: ChatState) -> ChatState:
     Args:
         state (ChatState): Current chat state containing:
             - current_message: Message object with audio property
-            - messages: List of conversation messages to append to
+            - messages: Conversation history
 
     Returns:
-        ChatState: Updated chat state with transcribed audio added as HumanMessage
+        Dict[str, Any]: State update with the transcribed audio as a HumanMessage
+        for the add_messages reducer to append
 
-    Note:
-        If transcription fails, an error is logged but the state is still returned
+    Raises:
+        ValueError: If downloading or transcribing the audio fails
     """
-    logger.info(f"[HANDLE_AUDIO_NODE] Started processing audio message")
-    transcribed_audio_message = transcribe_audio(state.current_message.audio)
+    logger.info("[HANDLE_AUDIO_NODE] Started processing audio message")
+    transcribed_audio_message = await transcribe_audio(state["current_message"].audio)
     logger.info(
-        f"[HANDLE_AUDIO_NODE] Transcribed Audio Message Received From User: {transcribed_audio_message}"
+        "[HANDLE_AUDIO_NODE] Transcribed Audio Message Received From User: %s",
+        transcribed_audio_message,
     )
-    if isinstance(transcribed_audio_message, str):
-        state.messages.append(HumanMessage(content=transcribed_audio_message))
-        return state
-    else:
-        logger.error(
-            f"[HANDLE_AUDIO_NODE] Error transcribing audio message: {response}"
-        )
-        response = "Error transcribing audio message"
-    return state
+    return {"messages": [HumanMessage(content=transcribed_audio_message)]}
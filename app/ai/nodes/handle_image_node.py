@@ -1,20 +1,23 @@
-import base64
+import binascii
 from langchain_core.messages import HumanMessage
 from app.schemas.chat import Image
-import os
-from app.ai.nodes.shared import download_file_from_facebook
+from app.ai.nodes.shared import download_file_to_memory
+from typing import Any, Dict
 from app.ai.schemas.workflow_states import ChatState
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Raw bytes encoded per step; a multiple of 3 so chunks need no base64 padding
+_ENCODE_CHUNK_SIZE = 3 * 64 * 1024
 
-def get_base64_image(image: Image) -> str:
+
+async def get_base64_image(image: Image) -> str:
     """
     Download and convert an image from WhatsApp to base64 format.
 
-    This function downloads an image file from Facebook's servers using the image ID,
-    converts it to a base64-encoded data URI, and cleans up the temporary file.
+    This function downloads an image file from Facebook's servers into memory using
+    the image ID and converts it to a base64-encoded data URI without touching disk.
     The resulting base64 string includes the proper MIME type prefix for web display.
 
     Args:
@@ -28,25 +31,26 @@ def get_base64_image(image: Image) -> str:
     Raises:
         ValueError: If download fails or file processing errors occur
     """
-    logger.info(f"[HANDLE_IMAGE_NODE] Downloading image file from Facebook")
-    image_path = download_file_from_facebook(image.id, "image", image.mime_type)
-    logger.info(f"[HANDLE_IMAGE_NODE] Downloaded image file path: {image_path}")
-    with open(image_path, "rb") as image_binary:
-        logger.info(f"[HANDLE_IMAGE_NODE] Starting to convert image file to base64")
-        base64_str = base64.b64encode(image_binary.read()).decode("utf-8")
-        base64_image = f"data:{image.mime_type};base64,{base64_str}"
-        logger.info(f"[HANDLE_IMAGE_NODE] Image file converted to base64 successfully")
-    try:
-        os.remove(image_path)
-        logger.info(
-            f"[HANDLE_IMAGE_NODE] Image file processed and deleted successfully"
-        )
-    except Exception as e:
-        logger.error(f"[HANDLE_IMAGE_NODE] Failed to delete image file: {e}")
+    image_buffer = await download_file_to_memory(image.id, image.mime_type)
+    # Encode chunk by chunk into the data URI itself, so no full-size
+    # intermediate encoded copy is built before the final string
+    data_uri = bytearray(b"data:" + image.mime_type.encode("ascii") + b";base64,")
+    with image_buffer.getbuffer() as raw:
+        for start in range(0, len(raw), _ENCODE_CHUNK_SIZE):
+            data_uri += binascii.b2a_base64(
+                raw[start : start + _ENCODE_CHUNK_SIZE], newline=False
+            )
+    base64_image = data_uri.decode("ascii")
+    logger.info(
+        "[HANDLE_IMAGE_NODE] Image pipeline: downloaded=%s size=%d encoded=%d",
+        image_buffer.name,
+        image_buffer.getbuffer().nbytes,
+        len(base64_image),
+    )
     return base64_image
 
 
-def handle_image_node(state: ChatState) -> ChatState:
+async def handle_image_node(state: ChatState) -> Dict[str, Any]:
     """
     Workflow node that processes image messages from WhatsApp.
 
@@ -57,20 +61,21 @@ def handle_image_node(state: ChatState) -> ChatState:
     Args:
         state (ChatState): Current chat state containing:
             - current_message: Message object with image property
-            - messages: List of conversation messages to append to
+            - messages: Conversation history
 
     Returns:
-        ChatState: Updated chat state with image message added as HumanMessage
-        containing structured content with image_url and optional text components
+        Dict[str, Any]: State update with the image message as a HumanMessage
+        containing structured content with image_url and optional text components,
+        for the add_messages reducer to append
 
     Note:
         The resulting message format is compatible with OpenAI's vision models
         that can process both text and image content
     """
 
-    logger.info(f"[HANDLE_IMAGE_NODE] Started processing image message")
-    image_data = state.current_message.image
-    image_base64 = get_base64_image(image_data)
+    logger.info("[HANDLE_IMAGE_NODE] Started processing image message")
+    image_data = state["current_message"].image
+    image_base64 = await get_base64_image(image_data)
 
     image_messages = []
 
@@ -92,9 +97,11 @@ def handle_image_node(state: ChatState) -> ChatState:
             }
         )
 
-    logger.info(
-        f"[HANDLE_IMAGE_NODE] Image Message Received From User: {image_messages}"
-    )
+    # The payload embeds the full base64 image, so only dump it at DEBUG
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[HANDLE_IMAGE_NODE] Image Message Received From User: %s",
+            image_messages,
+        )
 
-    state.messages.append(HumanMessage(content=image_messages))
-    return state
+    return {"messages": [HumanMessage(content=image_messages)]}
@@ -1,4 +1,5 @@
 from langchain_core.messages import HumanMessage
+from typing import Any, Dict
 from app.ai.schemas.workflow_states import ChatState
 import logging
 
@@ -6,7 +7,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def handle_text_node(state: ChatState) -> ChatState:
+async def handle_text_node(state: ChatState) -> Dict[str, Any]:
     """
     Workflow node that processes text messages from WhatsApp.
 
@@ -17,17 +18,17 @@ def handle_text_node(state: ChatState) -> ChatState:
     Args:
         state (ChatState): Current chat state containing:
             - current_message: Message object with text property containing body
-            - messages: List of conversation messages to append to
+            - messages: Conversation history
 
     Returns:
-        ChatState: Updated chat state with text message added as HumanMessage
+        Dict[str, Any]: State update with the text message as a HumanMessage
+        for the add_messages reducer to append
 
     Note:
-        The text content is extracted from state.current_message.text.body
+        The text content is extracted from state["current_message"].text.body
     """
-    logger.info(f"[HANDLE_TEXT_NODE] Started processing text message")
-    text_message = state.current_message.text.body
-    logger.info(f"[HANDLE_TEXT_NODE] Text Message Received From User: {text_message}")
+    logger.info("[HANDLE_TEXT_NODE] Started processing text message")
+    text_message = state["current_message"].text.body
+    logger.info("[HANDLE_TEXT_NODE] Text Message Received From User: %s", text_message)
 
-    state.messages.append(HumanMessage(content=text_message))
-    return state
+    return {"messages": [HumanMessage(content=text_message)]}
@@ -1,71 +1,207 @@
+import time
+from io import BytesIO
+from typing import NamedTuple, Optional
+import httpx
+from cachetools import LRUCache
 from app.core.config import settings
-import requests
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def download_file_from_facebook(
-    file_id: str, file_type: str, mime_type: str
-) -> str | None:
+# Base URL for relative requests made with the shared client
+_GRAPH_API_BASE_URL = "https://graph.facebook.com"
+
+# Global shared HTTP client instance
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+# Connection pool bounds for the shared client
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+
+# Connect attempts retried by the transport before a request fails
+_HTTP_CONNECT_RETRIES = 3
+
+# Read size when streaming media downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class _CachedMedia(NamedTuple):
+    """Downloaded media content with its validator and freshness deadline."""
+
+    content: bytes
+    etag: Optional[str]
+    fresh_until: float
+
+
+# In-memory media cache keyed by file ID, bounded by total content size
+_MEDIA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_media_cache: LRUCache = LRUCache(
+    maxsize=_MEDIA_CACHE_MAX_BYTES, getsizeof=lambda entry: len(entry.content)
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get shared httpx.AsyncClient instance for all outbound Graph API requests.
+
+    This creates a single AsyncClient whose connection pool (keep-alive and
+    TLS sessions) is reused across requests instead of reconnecting per call.
+    Relative URLs resolve against graph.facebook.com and the WhatsApp API key
+    is sent as a default Authorization header.
+
+    Returns:
+        httpx.AsyncClient: Shared client instance
+    """
+    global _shared_http_client
+
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            limits=_HTTP_LIMITS, retries=_HTTP_CONNECT_RETRIES
+        )
+        _shared_http_client = httpx.AsyncClient(
+            transport=transport,
+            base_url=_GRAPH_API_BASE_URL,
+            headers={"Authorization": f"Bearer {settings.WHATSAPP_API_KEY}"},
+            timeout=30.0,
+            follow_redirects=True,
+        )
+        logger.info("Created shared httpx AsyncClient")
+
+    return _shared_http_client
+
+
+async def close_shared_http_client():
+    """
+    Close the shared HTTP client and release its pooled connections.
+
+    The client is recreated on the next get_shared_http_client() call.
+    """
+    global _shared_http_client
+
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+        logger.info("Closed shared httpx AsyncClient")
+
+
+async def download_file_to_memory(file_id: str, mime_type: str) -> BytesIO:
     """
-    Download a media file from Facebook's servers using WhatsApp API.
+    Download a media file from Facebook's servers into an in-memory buffer.
 
     This function performs a two-step process to download media files:
     1. First GET request to retrieve the download URL using the file ID
     2. Second GET request to download the actual file content
-    The downloaded file is saved locally with an appropriate file extension.
+    The content is kept in memory instead of being written to and re-read from disk.
 
     Args:
         file_id (str): Facebook media ID for the file to download
-        file_type (str): Type of media file ('image', 'audio', etc.)
         mime_type (str): MIME type of the file (e.g., 'image/jpeg', 'audio/ogg')
 
     Returns:
-        str | None: Local file path where the downloaded file was saved,
-        or None if the file type is not supported
+        BytesIO: Buffer holding the file content. Its name attribute is set to
+        '{file_id}.{extension}' so clients can infer the file format.
 
     Raises:
         ValueError: If either API request fails or returns non-200 status code
-
-    Note:
-        Only 'image' and 'audio' file types are currently supported for return.
-        The file extension is extracted from the mime_type parameter.
     """
     logger.info(
-        f"Downloading file from Facebook with file id: {file_id}, file type: {file_type}, mime type: {mime_type}"
+        "Downloading file from Facebook into memory with file id: %s, mime type: %s",
+        file_id,
+        mime_type,
     )
+    buffer = BytesIO()
+    await _fetch_file_content(file_id, buffer)
+    buffer.seek(0)
+    file_extension = mime_type.split("/")[-1].split(";")[0]
+    buffer.name = f"{file_id}.{file_extension}"
+    return buffer
+
+
+async def _fetch_file_content(file_id: str, buffer: BytesIO):
+    """
+    Resolve the download URL for a media file and stream its content into a buffer.
+
+    The body is written chunk by chunk as it arrives instead of being held in
+    the response first and copied afterwards. Downloads are cached in memory:
+    content still fresh per Cache-Control max-age is served without any request,
+    and stale content is revalidated with If-None-Match so a 304 skips the body.
+
+    Args:
+        file_id (str): Facebook media ID for the file to download
+        buffer (BytesIO): Buffer the file content is written to
+
+    Raises:
+        ValueError: If either API request fails or returns non-200 status code
+    """
+    cached = _media_cache.get(file_id)
+    if cached is not None and cached.fresh_until > time.monotonic():
+        logger.info("Serving file %s from media cache", file_id)
+        buffer.write(cached.content)
+        return
+
     # First GET request to retrieve the download URL
-    url = f"https://graph.facebook.com/v20.0/{file_id}"
-    headers = {"Authorization": f"Bearer {settings.WHATSAPP_API_KEY}"}
-    response = requests.get(url, headers=headers)
+    client = get_shared_http_client()
+    response = await client.get(f"/v20.0/{file_id}")
 
     if response.status_code == 200:
         download_url = response.json().get("url")
 
-        # Second GET request to download the file
-        response = requests.get(download_url, headers=headers)
+        download_headers = None
+        if cached is not None and cached.etag:
+            download_headers = {"If-None-Match": cached.etag}
 
-        if response.status_code == 200:
-            file_extension = mime_type.split("/")[-1].split(";")[
-                0
-            ]  # Extract file extension from mime_type
-            file_path = f"{file_id}.{file_extension}"
-            with open(file_path, "wb") as file:
-                file.write(response.content)
-            if file_type == "image" or file_type == "audio":
-                return file_path
+        # Second GET request to stream the file
+        async with client.stream(
+            "GET", download_url, headers=download_headers
+        ) as response:
+            if response.status_code == 304 and cached is not None:
+                logger.info("File %s not modified, serving from media cache", file_id)
+                buffer.write(cached.content)
+                _cache_media(file_id, cached.content, response.headers)
+                return
+
+            if response.status_code == 200:
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+                _cache_media(file_id, buffer.getvalue(), response.headers)
+                return
 
         logger.error(
-            f"Failed to download file from Facebook. Status code: {response.status_code}"
+            "Failed to download file from Facebook. Status code: %s",
+            response.status_code,
         )
         raise ValueError(
             f"Failed to download file. Status code: {response.status_code}"
         )
 
     logger.error(
-        f"Failed to retrieve download URL. Status code: {response.status_code}"
+        "Failed to retrieve download URL. Status code: %s",
+        response.status_code,
     )
     raise ValueError(
         f"Failed to retrieve download URL. Status code: {response.status_code}"
     )
+
+
+def _cache_media(file_id: str, content: bytes, headers: httpx.Headers):
+    """
+    Store downloaded media in the cache if the response allows reusing it.
+
+    Args:
+        file_id (str): Facebook media ID the content belongs to
+        content (bytes): Downloaded file content
+        headers (httpx.Headers): Response headers carrying ETag and Cache-Control
+    """
+    etag = headers.get("ETag")
+    max_age = 0
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-store", "private"):
+            _media_cache.pop(file_id, None)
+            return
+        if name == "max-age" and value.isdigit():
+            max_age = int(value)
+
+    if (etag or max_age) and len(content) <= _MEDIA_CACHE_MAX_BYTES:
+        _media_cache[file_id] = _CachedMedia(content, etag, time.monotonic() + max_age)
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from typing import Optional, Set
+import orjson
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from tenacity.wait import wait_base
+from app.core.config import settings
+from app.ai.nodes.shared import get_shared_http_client
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Outbound rate limit (messages per second) applied across all sends
+_RATE_PER_SECOND = 200.0
+
+# Request parts shared by every text message send
+_MESSAGES_URL = f"/v22.0/{settings.WHATSAPP_PHONE_NUMBER_ID}/messages"
+_HEADERS = {"Content-Type": "application/json"}
+_TEXT_PAYLOAD_TEMPLATE = {
+    "messaging_product": "whatsapp",
+    "preview_url": False,
+    "recipient_type": "individual",
+    "type": "text",
+}
+
+# Transient Graph API statuses worth retrying, and the retry budget
+_RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+_MAX_SEND_ATTEMPTS = 4
+_MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class _RetryableSendError(Exception):
+    """Raised for transient send failures that should be retried."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float]):
+        super().__init__(f"Failed to send message. Status code: {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class _WaitRetryAfter(wait_base):
+    """Wait for the server's Retry-After if given, else back off exponentially."""
+
+    def __init__(self, fallback: wait_base):
+        self._fallback = fallback
+
+    def __call__(self, retry_state) -> float:
+        error = retry_state.outcome.exception()
+        if isinstance(error, _RetryableSendError) and error.retry_after is not None:
+            return error.retry_after
+        return self._fallback(retry_state)
+
+
+class _TokenBucket:
+    """
+    Simple token bucket used to cap the outbound WhatsApp send rate.
+
+    Only used from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float):
+        """Hold back all sends for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+# Global sender state: background send tasks and the shared rate limiter
+_background_sends: Set[asyncio.Task] = set()
+_rate_limiter = _TokenBucket(_RATE_PER_SECOND, _RATE_PER_SECOND)
+
+
+async def send_text_message(to: str, message: str):
+    """
+    Send a WhatsApp text message, subject to the outbound rate limit.
+
+    Each call sends independently, so one send retrying does not hold up the
+    others; a Retry-After still pauses every send through the shared limiter.
+
+    Args:
+        to (str): Recipient phone number
+        message (str): Text body to send
+
+    Raises:
+        Exception: If the WhatsApp API request fails or returns an error response
+    """
+    data = {**_TEXT_PAYLOAD_TEMPLATE, "to": to, "text": {"body": message}}
+    await _post_message(_MESSAGES_URL, _HEADERS, orjson.dumps(data))
+
+
+def send_text_message_in_background(to: str, message: str):
+    """
+    Send a WhatsApp text message without waiting for the API to acknowledge it.
+
+    The send (including retries) runs as a background task; a final failure is
+    logged rather than raised to the caller.
+
+    Args:
+        to (str): Recipient phone number
+        message (str): Text body to send
+    """
+    task = asyncio.create_task(send_text_message(to, message))
+    _background_sends.add(task)
+    task.add_done_callback(_on_background_send_done)
+
+
+def _on_background_send_done(task: asyncio.Task):
+    """Drop the finished task and log a failed send."""
+    _background_sends.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("[WHATSAPP_SENDER] Background send failed: %s", task.exception())
+
+
+async def close_whatsapp_sender():
+    """Wait for in-flight background sends to finish."""
+    if _background_sends:
+        await asyncio.gather(*_background_sends, return_exceptions=True)
+
+
+@retry(
+    stop=stop_after_attempt(_MAX_SEND_ATTEMPTS),
+    wait=_WaitRetryAfter(wait_exponential_jitter(initial=0.25, max=4.0)),
+    retry=retry_if_exception_type(_RetryableSendError),
+    reraise=True,
+)
+async def _post_message(url: str, headers: dict, body: bytes):
+    """
+    POST a message to the Graph API, retrying transient failures.
+
+    Args:
+        url (str): Messages endpoint relative to the Graph API base URL
+        headers (dict): Request headers
+        body (bytes): Serialized JSON payload
+
+    Raises:
+        Exception: If the request fails with a non-retryable status or
+            still fails after the last attempt
+    """
+    await _rate_limiter.acquire()
+    client = get_shared_http_client()
+    response = await client.post(url, headers=headers, content=body, timeout=10)
+
+    if response.status_code in _RETRY_STATUS_CODES:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            # Back off every queued send, not only this one
+            _rate_limiter.pause(retry_after)
+        logger.warning(
+            "[WHATSAPP_SENDER] Transient send failure (status %s), retrying",
+            response.status_code,
+        )
+        raise _RetryableSendError(response.status_code, retry_after)
+
+    if not response.is_success:
+        raise Exception(f"Failed to send message. Status code: {response.status_code}")
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds, capped to a sane maximum."""
+    if value is None or not value.strip().isdigit():
+        return None
+    return min(float(value.strip()), _MAX_RETRY_AFTER_SECONDS)
@@ -1,16 +1,17 @@
-from typing import Annotated, Sequence
-from pydantic import BaseModel
+from typing import Annotated, Sequence, TypedDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
 from app.schemas.chat import Message
 
-class ChatState(BaseModel):
+class ChatState(TypedDict):
     """
     State schema for chat workflow.
 
     Follows LangGraph documentation pattern with message history and context.
-    Used for conversational chat with persistent message history.
+    Used for conversational chat with persistent message history. A TypedDict
+    keeps node updates free of per-transition model validation; the incoming
+    Message is still validated by pydantic at the webhook boundary.
     """
     messages: Annotated[Sequence[BaseMessage], add_messages]
     current_message: Message
@@ -5,19 +5,33 @@ This service handles chat functionality with conversation
 persistence using LangGraph workflows.
 """
 
-from typing import Dict, Any, Optional
-from langchain_core.messages import HumanMessage, AIMessage
-from app.ai.workflows.chat_workflow import (
-    create_chat_workflow,
-    validate_chat_input,
-    prepare_chat_config,
-)
+from typing import Dict, Any, Optional, Sequence
+from langchain_core.messages import AIMessage, BaseMessage
 import logging
-from app.ai.services.checkpointer_service import CheckpointerService
+from app.ai.services.checkpointer_service import get_checkpointer_service
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_last_ai_message(messages: Sequence[BaseMessage]) -> Optional[AIMessage]:
+    """
+    Get the most recent AI message from a conversation.
+
+    The workflow ends right after the AI reply is sent, so the last message is
+    checked first and the history is only scanned as a fallback.
+
+    Args:
+        messages: Conversation messages in chronological order
+
+    Returns:
+        The last AIMessage, or None if the conversation has none
+    """
+    # Compare the message type tag rather than walking the class hierarchy
+    if messages and messages[-1].type == "ai":
+        return messages[-1]
+    return next((msg for msg in reversed(messages) if msg.type == "ai"), None)
+
+
 class ChatService:
     """
     Service for AI chat operations.
@@ -31,40 +45,45 @@ class ChatService:
         Initialize ChatService with required dependencies.
         """
 
-        # Use singleton pattern for checkpointer service
-        self._checkpointer_service = CheckpointerService()
+        # Shared process-wide checkpointer service
+        self._checkpointer_service = get_checkpointer_service()
 
     async def _get_workflow(self, async_mode: bool = False):
         """
         Get or create chat workflow.
 
+        The compiled workflow is cached per process by create_chat_workflow,
+        so this is cheap after the first call.
+
         Args:
-            resource_id: Resource UUID
             async_mode: If True, create async workflow for streaming
 
         Returns:
             Compiled LangGraph workflow
         """
         try:
-            logger.info(
-                f"[CHAT_SERVICE] Creating {'async' if async_mode else 'sync'} workflow"
+            logger.debug(
+                "[CHAT_SERVICE] Creating %s workflow", "async" if async_mode else "sync"
             )
 
-            # Reuse existing checkpointer service (singleton pattern)
+            # Reuse the shared checkpointer service
             # This prevents creating multiple connection pools
             checkpointer_service = self._checkpointer_service
 
+            # Imported here so loading this module does not pull in the whole graph
+            from app.ai.workflows.chat_workflow import create_chat_workflow
+
             # Create workflow with proper async/sync mode
             workflow = await create_chat_workflow(
                 checkpointer_service=checkpointer_service,
                 async_mode=async_mode,  # Use proper async/sync mode
             )
 
-            logger.info(f"[CHAT_SERVICE] Chat Workflow created successfully")
+            logger.debug("[CHAT_SERVICE] Chat Workflow created successfully")
             return workflow
 
         except Exception as e:
-            logger.error(f"[CHAT_SERVICE] Failed to create chat workflow: {str(e)}")
+            logger.error("[CHAT_SERVICE] Failed to create chat workflow: %s", e)
             raise RuntimeError(f"Failed to create chat workflow: {str(e)}")
 
     async def send_message(
@@ -74,8 +93,7 @@ class ChatService:
         Send a chat message and get AI response using chat workflow.
 
         Args:
-            resource_id: Resource UUID
-            sender: sender phone number
+            message: Incoming WhatsApp message
             thread_id: Optional thread ID for conversation persistence
 
         Returns:
@@ -86,9 +104,7 @@ class ChatService:
         """
         try:
 
-            logger.info(
-                f"[CHAT_SERVICE] Processing chat message for thread {thread_id}"
-            )
+            logger.info("[CHAT_SERVICE] Processing chat message for thread %s", thread_id)
 
             # Prepare workflow input
             input_data = {
@@ -96,41 +112,43 @@ class ChatService:
                 "thread_id": thread_id or "default",
             }
 
-            # Debug: Log what we're preparing
-            logger.info(f"[CHAT_SERVICE] Input data: {input_data}")
+            from app.ai.workflows.chat_workflow import (
+                get_chat_app,
+                prepare_chat_config,
+                validate_chat_input,
+            )
 
             # Validate input
             validated_input = validate_chat_input(input_data)
             config = prepare_chat_config(thread_id or "default")
 
             # Debug: Log what we're passing to the workflow
-            logger.info(f"[CHAT_SERVICE] Validated input: {validated_input}")
-            logger.info(f"[CHAT_SERVICE] Config: {config}")
-
-            # Get async workflow for regular chat (consistent with ainvoke)
-            workflow = await self._get_workflow(async_mode=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CHAT_SERVICE] Validated input: %s", validated_input)
+                logger.debug("[CHAT_SERVICE] Config: %s", config)
+
+            # Get async workflow for regular chat (consistent with ainvoke);
+            # normally already compiled at startup
+            workflow = get_chat_app(async_mode=True) or await self._get_workflow(
+                async_mode=True
+            )
 
             # Execute workflow
-            logger.info(f"[CHAT_SERVICE] Executing async workflow")
+            logger.debug("[CHAT_SERVICE] Executing async workflow")
             result = await workflow.ainvoke(validated_input, config=config)
             # Extract response
             messages = result.get("messages", [])
 
             # Get AI message from result
-            ai_message = None
-            if messages:
-                for msg in reversed(messages):
-                    if isinstance(msg, AIMessage):
-                        ai_message = msg.content
-                        break
-
-            if not ai_message:
-                ai_message = ""
-
-            logger.info(
-                f"[CHAT_SERVICE] Successfully processed message"
-            )
-            logger.info(f"[CHAT_SERVICE] Generated response length: {len(ai_message)} characters")
+            last_ai_message = _extract_last_ai_message(messages)
+            ai_message = last_ai_message.content if last_ai_message else ""
+
+            logger.info("[CHAT_SERVICE] Successfully processed message")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[CHAT_SERVICE] Generated response length: %d characters",
+                    len(ai_message),
+                )
 
             return {
                 "ai_message": ai_message,
@@ -138,7 +156,5 @@ class ChatService:
             }
 
         except Exception as e:
-            logger.error(
-                f"[CHAT_SERVICE] Failed to process chat message: {str(e)}"
-            )
+            logger.error("[CHAT_SERVICE] Failed to process chat message: %s", e)
             raise RuntimeError(f"Failed to process chat message: {str(e)}")
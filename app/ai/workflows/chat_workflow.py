@@ -5,11 +5,15 @@ This follows the established pattern where workflows are pure functions
 that define the graph structure and return compiled applications.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Optional
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, START, END
+from langgraph.graph.state import CompiledStateGraph
 from app.ai.nodes.chat_processor_node import chat_processor_node
-from app.ai.services.checkpointer_service import CheckpointerService
+from app.ai.services.checkpointer_service import get_checkpointer_service
 from app.ai.schemas.workflow_states import ChatState
 from app.ai.nodes.handle_image_node import handle_image_node
 from app.ai.nodes.handle_audio_node import handle_audio_node
@@ -19,6 +23,19 @@ from app.ai.nodes.send_whatsapp_message_node import send_whatsapp_message_node
 logger = logging.getLogger(__name__)
 
 
+# Handler node for each supported message type, built once at import
+_ROUTES: Dict[str, str] = {
+    sys.intern("image"): "handle_image",
+    sys.intern("audio"): "handle_audio",
+    sys.intern("text"): "handle_text",
+}
+
+# Compiled apps keyed by async_mode, built once per process; an app compiled
+# with the memory checkpointer is not kept, so the next call recompiles it
+_compiled_apps: Dict[bool, Any] = {}
+_compile_lock = asyncio.Lock()
+
+
 async def create_chat_workflow(
     checkpointer_service=None,
     async_mode: bool = False,
@@ -26,52 +43,83 @@ async def create_chat_workflow(
     """
     Create chat workflow for chat functionality.
 
+    The graph is built and compiled once per async_mode and the compiled app is
+    reused afterwards; a lock keeps concurrent first calls from compiling twice.
+    An app compiled with the memory checkpointer is returned without being kept,
+    so it is rebuilt against PostgreSQL once that becomes available.
+
     Uses proper PostgreSQL checkpointer context manager pattern.
     """
+    app = get_chat_app(async_mode)
+    if app is not None:
+        return app
+
+    async with _compile_lock:
+        app = _compiled_apps.get(async_mode)
+        if app is None:
+            app = await _build_chat_workflow(checkpointer_service, async_mode)
+            if not isinstance(app.checkpointer, MemorySaver):
+                _compiled_apps[async_mode] = app
+        return app
+
+
+def get_chat_app(async_mode: bool = True) -> Optional[CompiledStateGraph]:
+    """
+    Get the already compiled chat app without awaiting anything.
+
+    The app is compiled at startup by the lifespan warmup; until then (or if
+    warmup failed) this returns None and callers fall back to
+    create_chat_workflow().
+
+    Args:
+        async_mode: If True, get the app compiled with the async checkpointer
+
+    Returns:
+        Compiled LangGraph workflow, or None if not compiled yet
+    """
+    return _compiled_apps.get(async_mode)
+
+
+async def _build_chat_workflow(checkpointer_service, async_mode: bool):
+    """
+    Build the chat graph and compile it with the checkpointer.
+
+    Args:
+        checkpointer_service: Checkpointer service to use, or None for the shared one
+        async_mode: If True, compile with the async checkpointer
+
+    Returns:
+        Compiled LangGraph workflow
+    """
 
     # Create workflow with proper state schema
     workflow = StateGraph(ChatState)
 
     # Add nodes
-    workflow.add_node("start", lambda state: state)
     workflow.add_node("handle_image", handle_image_node)
     workflow.add_node("handle_audio", handle_audio_node)
     workflow.add_node("handle_text", handle_text_node)
     workflow.add_node("chat_processor", chat_processor_node)
     workflow.add_node("send_message", send_whatsapp_message_node)
 
-    def route_by_message_type(
-        state: ChatState,
-    ) -> str:
-        """Routes to the appropriate handler based on message type."""
-        logger.info(
-            f"[CHAT_WORKFLOW] Received {state.current_message.type} from user {state.current_message.from_}"
-        )
-        return state.current_message.type
-
-    # Conditional edge from start to appropriate handler
+    # Route straight from the graph entry to the appropriate handler
     workflow.add_conditional_edges(
-        "start",
-        route_by_message_type,
-        {
-            "image": "handle_image",
-            "audio": "handle_audio",
-            "text": "handle_text",
-        },
+        START,
+        _route_by_message_type,
+        list(_ROUTES.values()),
     )
 
     # Add edges
-    workflow.add_edge(START, "start")
     workflow.add_edge("handle_text", "chat_processor")
     workflow.add_edge("handle_image", "chat_processor")
     workflow.add_edge("handle_audio", "chat_processor")
     workflow.add_edge("chat_processor", "send_message")
     workflow.add_edge("send_message", END)
 
-    # Use provided checkpointer service or create new one
+    # Use provided checkpointer service or the shared one
     if checkpointer_service is None:
-        checkpointer_service = CheckpointerService()
-        logger.info("[CHAT_WORKFLOW] Created new CheckpointerService")
+        checkpointer_service = get_checkpointer_service()
+        logger.info("[CHAT_WORKFLOW] Using shared CheckpointerService")
     else:
         logger.info(
             "[CHAT_WORKFLOW] Using provided CheckpointerService with shared connection"
@@ -87,18 +135,33 @@ async def create_chat_workflow(
 
     # Log checkpointer type
     checkpointer_type = checkpointer_service.get_checkpointer_type(checkpointer)
-    logger.info(f"[CHAT_WORKFLOW] Using {checkpointer_type} checkpointer")
+    logger.info("[CHAT_WORKFLOW] Using %s checkpointer", checkpointer_type)
 
     # Compile workflow with checkpointer
     # Note: For PostgreSQL checkpointers, LangGraph will handle the context manager
     app = workflow.compile(checkpointer=checkpointer)
 
-    logger.info(f"[CHAT_WORKFLOW] Workflow compiled successfully")
+    logger.info("[CHAT_WORKFLOW] Workflow compiled successfully")
 
     return app
 
 
-def validate_chat_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+def _route_by_message_type(state: ChatState) -> str:
+    """
+    Route to the handler node for the current message type.
+
+    Raises:
+        KeyError: If the message type is not supported
+    """
+    message = state["current_message"]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[CHAT_WORKFLOW] Received %s from user %s", message.type, message.from_
+        )
+    return _ROUTES[message.type]
+
+
+def validate_chat_input(input_data: Dict[str, Any]) -> ChatState:
     """
     Validate and prepare input for chat workflow.
 
@@ -109,7 +172,7 @@ def validate_chat_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
         input_data: Raw input data
 
     Returns:
-        Validated and formatted state dict
+        Validated ChatState input for the workflow
 
     Raises:
         ValueError: If input validation fails
@@ -126,14 +189,13 @@ def validate_chat_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("Sender is required")
 
     # Prepare state with current message
-    state = {
-        "current_message": message,
-        "messages": [],
-    }
+    state = ChatState(current_message=message, messages=[])
 
-    logger.info(
-        f"[CHAT_WORKFLOW] Prepared input state with current message for thread_id: {thread_id}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[CHAT_WORKFLOW] Prepared input state with current message for thread_id: %s",
+            thread_id,
+        )
 
     return state
 
@@ -1,7 +1,9 @@
+import logging
 from tokenize import Token
 from typing import Annotated
 from fastapi import APIRouter, HTTPException, status
 from fastapi.params import Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from app.core.dependencies import get_auth_service, get_user_service
 from app.schemas.auth import AuthResponse, UserRegister, UserResponse, Token
@@ -9,6 +11,8 @@ from app.schemas.user import UserCreate
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -17,8 +21,9 @@ async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ):
-    user = auth_service.authenticate_user(
-        form_data.username, form_data.password
+    # bcrypt verification is CPU-bound, so keep it off the event loop
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, form_data.username, form_data.password
     )  # username field contains email
     if not user:
         raise HTTPException(
@@ -40,7 +45,7 @@ async def login(
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "roles": [role.name for role in user.roles],
+        "roles": list(user.role_names),
     }
 
 
@@ -67,7 +72,8 @@ async def register(
             password=user_data.password,
             roles=user_data.roles,
         )
-        user = user_service.create_user(user_create)
+        # Password hashing is CPU-bound; keep it off the event loop
+        user = await run_in_threadpool(user_service.create_user, user_create)
 
         # Generate token with both user object and sub
         access_token = auth_service.create_access_token(
@@ -80,12 +86,11 @@ async def register(
             token=Token(
                 access_token=access_token,
                 token_type="bearer",
-                roles=[role.name for role in user.roles],
+                roles=list(user.role_names),
             ),
         )
     except Exception as e:
-        # Log the actual error for debugging (can be removed in production)
-        print(f"Registration error: {str(e)}")
+        logger.error("[AUTH_ENDPOINT] Registration error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create user",
@@ -1,20 +1,26 @@
+import hmac
 import logging
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from app.ai.dependencies import ChatServiceDep
 from app.core.dependencies import (
-    get_conversation_service,
     get_message_sender,
+    is_message_delivery,
     message_extractor,
+    parse_change,
+    parse_contact,
+    parse_message,
 )
 from app.core.config import settings
-from app.schemas.chat import Message, StatusResponse
-from app.services.conversation_service import ConversationService
+from app.schemas.chat import StatusResponse, Value
+from app.services.webhook_queue_service import enqueue_message
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Encoded once for the constant-time webhook verification check
+_VERIFY_TOKEN_BYTES = (settings.WHATSAPP_VERIFY_TOKEN or "").encode("utf-8")
+
 
 @router.get("/")
 async def verify_whatsapp(
@@ -31,7 +37,11 @@ async def verify_whatsapp(
     """
     Verify the WhatsApp webhook
     """
-    if hub_mode == "subscribe" and hub_verify_token == settings.WHATSAPP_VERIFY_TOKEN:
+    if (
+        hub_mode == "subscribe"
+        and _VERIFY_TOKEN_BYTES
+        and hmac.compare_digest(hub_verify_token.encode("utf-8"), _VERIFY_TOKEN_BYTES)
+    ):
         return hub_challenge
 
     raise HTTPException(status_code=403, detail="Invalid verification token")
@@ -39,16 +49,21 @@ async def verify_whatsapp(
 
 @router.post("/", status_code=200, response_model=StatusResponse)
 async def receive_whatsapp_message(
-    current_sender: Annotated[str, Depends(get_message_sender)],
-    message: Annotated[Message, Depends(message_extractor)],
-    chat_service: ChatServiceDep,
-    conversation_service: Annotated[
-        ConversationService, Depends(get_conversation_service)
-    ],
+    change: Annotated[Value | None, Depends(parse_change)],
 ):
-    if not current_sender and not message:
+    """
+    Acknowledge a WhatsApp webhook and queue its message for processing.
+
+    Meta expects a fast 200 response, so the conversation lookup, AI reply and
+    metadata update run in the webhook queue workers instead of here.
+    """
+    # Delivery receipts and other non-message changes need no further work
+    if not is_message_delivery(change):
         return StatusResponse(status="OK")
 
+    current_sender = get_message_sender(parse_contact(change))
+    message = message_extractor(parse_message(change))
+
     if not current_sender:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
@@ -59,22 +74,7 @@ async def receive_whatsapp_message(
 
         logger.info(f"[CHAT_ENDPOINT] Message Payload: {message}")
 
-        # Step 1: Get or create conversation through business service
-        conversation = conversation_service.get_or_create_conversation(
-            sender_id=current_sender,
-        )
-
-        # Step 2: Send message through AI service
-        await chat_service.send_message(
-            message=message,
-            thread_id=conversation.thread_id,
-        )
-
-        # Step 3: Update conversation metadata
-        conversation_service.update_conversation_metadata(
-            conversation_id=conversation.id,
-            sender_id=current_sender,
-            message_count_increment=2,  # User message + AI response
-        )
+        # Process in the background; a full queue sheds the message
+        enqueue_message(current_sender, message)
 
     return StatusResponse(status="OK")
@@ -2,6 +2,8 @@ from typing import List
 from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 from app.core.role_decorator import require_roles
 from app.models.role import RoleType
 from app.models.user import User as UserModel
@@ -11,6 +13,9 @@ from app.services.user_service import UserService
 
 router = APIRouter()
 
+# Validates a whole page of users in one pass
+_USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -27,8 +32,9 @@ async def get_all_users(
     skip: int = 0,
     limit: int = 100,
 ) -> List[UserResponse]:
-    users = user_service.get_users(current_user, skip=skip, limit=limit)
-    return [UserResponse.model_validate(user) for user in users]
+    return _USER_LIST_ADAPTER.validate_python(
+        user_service.get_users(current_user, skip=skip, limit=limit)
+    )
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -54,8 +60,12 @@ async def update_user(
     current_user: Annotated[UserModel, Depends(get_current_active_user)],
     user_service: Annotated[UserService, Depends(get_user_service)],
 ):
-    updated_user = user_service.update_user(
-        user_id=str(user_id), user_update=user_update, current_user=current_user
+    # May hash a new password; keep it off the event loop
+    updated_user = await run_in_threadpool(
+        user_service.update_user,
+        user_id=str(user_id),
+        user_update=user_update,
+        current_user=current_user,
     )
     if not updated_user:
         raise HTTPException(
@@ -1,7 +1,14 @@
+import atexit
+import copy
+import queue
+from functools import lru_cache
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from typing import List, Optional
-import os
 import logging
+import sys
+import orjson
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from rich.logging import RichHandler
 from rich.theme import Theme
 from rich.console import Console
@@ -17,36 +24,71 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
 
     # Security
-    SECRET_KEY: str = os.getenv("SECRET_KEY")
+    SECRET_KEY: Optional[str] = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    # bcrypt cost factor for new hashes; older, cheaper hashes are upgraded on login
+    BCRYPT_ROUNDS: int = 12
 
     # CORS
     ALLOWED_HOSTS: List[str] = ["*"]  # In production, specify actual domains
 
     # Database
-    DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
+    DATABASE_URL: Optional[str] = None
+    # SQLAlchemy connection pool (PostgreSQL only)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_TIMEOUT: int = 30
+    DB_STATEMENT_TIMEOUT_MS: int = 60000
+    # Executions before psycopg prepares a query server-side; set to 0 to
+    # disable when connecting through PgBouncer in transaction pooling mode
+    DB_PREPARE_THRESHOLD: int = 5
+    # Worker threads for sync dependencies, endpoints and run_in_threadpool
+    # calls; sized above the DB pool so CPU-bound work (bcrypt) never waits
+    # behind requests holding connections
+    THREADPOOL_SIZE: int = 60
+
+    # Checkpointer connection pool sizing
+    POSTGRES_POOL_MIN_SIZE: int = 3
+    POSTGRES_POOL_MAX_SIZE: int = 15
+    POSTGRES_POOL_MAX_IDLE: float = 600
+    POSTGRES_POOL_TIMEOUT: float = 30
 
     # Redis (for caching/sessions)
-    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    REDIS_URL: Optional[str] = None
 
     # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    DEBUG: bool = ENVIRONMENT == "development"
+    ENVIRONMENT: str = "development"
+    # Defaults to True in development unless set explicitly
+    DEBUG: bool = False
 
     # Log level
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG")
+    LOG_LEVEL: str = "DEBUG"
+    # Buffer log records and flush them in bulk (0 disables buffering)
+    LOG_BUFFER_CAPACITY: int = 0
+    LOG_RICH_MARKUP: bool = False
 
     # OpenAI
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    
+    OPENAI_API_KEY: Optional[str] = None
+    OPENAI_MODEL: str = "gpt-4o-mini"
+
     # Chat Configuration
-    MAX_MESSAGES_IN_CONTEXT: int = int(os.getenv("MAX_MESSAGES_IN_CONTEXT", "10"))
+    MAX_MESSAGES_IN_CONTEXT: int = 10
+
+    # Webhook processing: background workers and their bounded queue
+    WEBHOOK_WORKERS: int = 4
+    WEBHOOK_QUEUE_MAXSIZE: int = 1000
 
     # WhatsApp
-    WHATSAPP_API_KEY: str = os.getenv("WHATSAPP_API_KEY")
-    WHATSAPP_PHONE_NUMBER_ID: str = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
-    WHATSAPP_VERIFY_TOKEN: str = os.getenv("WHATSAPP_VERIFY_TOKEN")
+    WHATSAPP_API_KEY: Optional[str] = None
+    WHATSAPP_PHONE_NUMBER_ID: Optional[str] = None
+    WHATSAPP_VERIFY_TOKEN: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _default_debug_from_environment(self) -> "Settings":
+        if "DEBUG" not in self.model_fields_set:
+            self.DEBUG = self.ENVIRONMENT == "development"
+        return self
 
     class Config:
         case_sensitive = True
@@ -54,11 +96,51 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra environment variables
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, read from the environment and .env once.
 
+    Returns:
+        Settings: Cached settings instance
+    """
+    return Settings()
 
-def setup_logging():
-    """Configure beautiful colored logging with Rich."""
+
+settings = get_settings()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps exc_info so Rich can still render tracebacks.
+
+    The stock handler formats the record up front and drops exc_info; here
+    only the message is merged with its args before queueing.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that writes queued records to the output handler
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener():
+    """Stop the current log listener, flushing queued records, at exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+# Registered once so repeated setup_logging() calls don't stack exit hooks
+atexit.register(_stop_log_listener)
+
+
+def _create_rich_handler() -> RichHandler:
+    """Create the colored Rich console handler used in development."""
 
     # Create custom theme for log levels
     custom_theme = Theme(
@@ -97,6 +179,35 @@ def setup_logging():
         logging.Formatter(fmt="[%(name)s] %(message)s", datefmt="[%X]")
     )
 
+    return rich_handler
+
+
+class _JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
+def setup_logging():
+    """Configure Rich colored logging in development and JSON lines elsewhere."""
+
+    if settings.DEBUG:
+        console_handler = _create_rich_handler()
+    else:
+        # Plain JSON lines to stdout in production; cheap to format and easy
+        # for the log aggregator to parse
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_JsonFormatter())
+
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
@@ -104,8 +215,25 @@ def setup_logging():
     # Clear existing handlers
     root_logger.handlers.clear()
 
-    # Add rich handler
-    root_logger.addHandler(rich_handler)
+    # Output handler, optionally behind a buffer that flushes when full or on errors
+    if settings.LOG_BUFFER_CAPACITY > 0:
+        output_handler = MemoryHandler(
+            capacity=settings.LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=console_handler,
+        )
+    else:
+        output_handler = console_handler
+
+    # Log calls only enqueue records; a listener thread does the console I/O
+    # so slow terminal or pipe writes never block the event loop
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_RecordQueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, output_handler)
+    _log_listener.start()
 
     # Configure specific loggers with appropriate levels
     loggers_config = {
@@ -133,6 +261,12 @@ def setup_logging():
         "psycopg": logging.WARNING,
     }
 
+    # Rich markup in AI logger kwargs is only worth building when asked for,
+    # and never with the JSON formatter, which would emit the tags verbatim
+    from app.ai import AILogger
+
+    AILogger.use_rich_markup = settings.LOG_RICH_MARKUP and settings.DEBUG
+
     # Apply logger configurations
     for logger_name, level in loggers_config.items():
         logger = logging.getLogger(logger_name)
@@ -141,8 +275,17 @@ def setup_logging():
 
     # Log the setup completion
     setup_logger = logging.getLogger("app.core.config")
-    setup_logger.info("🎨 [bold green]Rich colored logging configured![/bold green]")
-    setup_logger.info(f"📊 Log level: [bold cyan]{settings.LOG_LEVEL}[/bold cyan]")
-    setup_logger.info(
-        f"🔧 Environment: [bold yellow]{settings.ENVIRONMENT}[/bold yellow]"
-    )
+    if settings.DEBUG:
+        setup_logger.info(
+            "🎨 [bold green]Rich colored logging configured![/bold green]"
+        )
+        setup_logger.info(f"📊 Log level: [bold cyan]{settings.LOG_LEVEL}[/bold cyan]")
+        setup_logger.info(
+            f"🔧 Environment: [bold yellow]{settings.ENVIRONMENT}[/bold yellow]"
+        )
+    else:
+        setup_logger.info(
+            "JSON logging configured (level %s, environment %s)",
+            settings.LOG_LEVEL,
+            settings.ENVIRONMENT,
+        )
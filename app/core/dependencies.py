@@ -1,24 +1,59 @@
 from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from fastapi.security import OAuth2PasswordBearer
-from app.core.guards.authorization_guard import AuthGuardDep
+from app.core.guards.authorization_guard import get_authorization_guard
 from app.db.dependencies import get_db
 from app.models.user import User
-from app.schemas.auth import TokenData
-from app.schemas.chat import Audio, Contact, Image, Message, MessageType, Payload
-from app.services.auth_service import AuthService
+from app.schemas.chat import (
+    Audio,
+    Contact,
+    Image,
+    Message,
+    MessageType,
+    Payload,
+    Value,
+)
+from app.services.auth_service import AuthService, decode_access_token
 from app.services.conversation_service import ConversationService
-from app.services.user_service import UserService
+from app.services.user_service import UserService, get_cached_user
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Built once so webhook bodies are validated straight from JSON bytes
+_PAYLOAD_ADAPTER = TypeAdapter(Payload)
 
-def parse_message(payload: Payload) -> Message | None:
-    if not payload.entry[0].changes[0].value.messages:
+
+async def parse_payload(request: Request) -> Payload:
+    try:
+        return _PAYLOAD_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+def parse_change(
+    payload: Annotated[Payload, Depends(parse_payload)],
+) -> Value | None:
+    # Empty entry/changes lists are acknowledged as no-ops instead of a 500
+    if not payload.entry or not payload.entry[0].changes:
+        return None
+    return payload.entry[0].changes[0].value
+
+
+def is_message_delivery(change: Value | None) -> bool:
+    """Whether a webhook change carries messages (not only statuses or errors)."""
+    return bool(change and change.messages)
+
+
+def parse_message(
+    change: Annotated[Value | None, Depends(parse_change)],
+) -> Message | None:
+    if not change or not change.messages:
         return None
-    return payload.entry[0].changes[0].value.messages[0]
+    return change.messages[0]
 
 
 def message_extractor(
@@ -34,10 +69,12 @@ def message_extractor(
     return None
 
 
-def parse_contact(payload: Payload) -> Contact | None:
-    if not payload.entry[0].changes[0].value.contacts:
+def parse_contact(
+    change: Annotated[Value | None, Depends(parse_change)],
+) -> Contact | None:
+    if not change or not change.contacts:
         return None
-    return payload.entry[0].changes[0].value.contacts[0]
+    return change.contacts[0]
 
 
 def get_message_sender(
@@ -60,41 +97,30 @@ def get_auth_service(db: Annotated[Session, Depends(get_db)]) -> AuthService:
 
 def get_user_service(
     db: Annotated[Session, Depends(get_db)],
-    auth_service: Annotated[AuthService, Depends(get_auth_service)],
-    auth_guard: AuthGuardDep,
 ) -> UserService:
-    return UserService(db, auth_service, auth_guard)
+    # Built directly so FastAPI resolves one dependency node instead of three
+    return UserService(db, AuthService(db), get_authorization_guard())
 
 
-def verify_token(
+def get_current_active_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    auth_service: Annotated[AuthService, Depends(get_auth_service)],
-) -> TokenData:
-    token_data = auth_service.verify_token(token)
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    # Resolved in one dependency: cached token decode, cached user lookup
+    token_data = decode_access_token(token)
     if not token_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return token_data
-
 
-def get_current_user(
-    token_data: Annotated[TokenData, Depends(verify_token)],
-    user_service: Annotated[UserService, Depends(get_user_service)],
-) -> User:
-    user = user_service.get_user_by_id(token_data.sub)
-    if not user:
+    current_user = get_cached_user(db, token_data.sub)
+    if not current_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    return user
-
 
-def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
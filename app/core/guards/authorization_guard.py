@@ -24,7 +24,7 @@ class AuthorizationGuard:
             return True
 
         # Rule 2: Admins can access any user's data
-        if current_user.is_admin() or current_user.is_super_admin():
+        if current_user.is_admin():
             return True
 
         return False
@@ -42,17 +42,21 @@ class AuthorizationGuard:
             return True
 
         # Rule 2: Admins can modify any user's data
-        if current_user.is_admin() or current_user.is_super_admin():
+        if current_user.is_admin():
             return True
 
         return False
 
 
+# The guard holds no state, so a single instance serves every request
+_authorization_guard = AuthorizationGuard()
+
+
 def get_authorization_guard() -> AuthorizationGuard:
     """
     Get AuthorizationGuard instance for dependency injection.
     """
-    return AuthorizationGuard()
+    return _authorization_guard
 
 
 # Dependency alias for dependency injection
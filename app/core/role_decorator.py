@@ -1,10 +1,31 @@
+import inspect
 from functools import wraps
-from typing import List, Callable, Any
+from typing import Annotated, List, Callable, Any, Optional, get_args, get_origin
 from fastapi import HTTPException, status
 from app.schemas.auth import RoleType
 from app.models.user import User
 
 
+def _find_current_user_index(func: Callable) -> Optional[int]:
+    """
+    Find the position of the current user parameter in func's signature.
+
+    Prefers a parameter named 'current_user', then the first one annotated
+    as User (including Annotated[User, ...]).
+    """
+    parameters = list(inspect.signature(func).parameters.values())
+    for index, parameter in enumerate(parameters):
+        if parameter.name == "current_user":
+            return index
+    for index, parameter in enumerate(parameters):
+        annotation = parameter.annotation
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+        if annotation is User:
+            return index
+    return None
+
+
 def require_roles(required_roles: List[RoleType]):
     """
     Decorator to enforce role-based access control at the route level.
@@ -26,21 +47,24 @@ def require_roles(required_roles: List[RoleType]):
         HTTPException: If user doesn't have required roles
     """
 
+    # Built once per route instead of on every request
+    required_role_names = frozenset(role.value for role in required_roles)
+    required_roles_detail = f"Required roles: {[role.value for role in required_roles]}"
+
     def decorator(func: Callable) -> Callable:
+        # Resolved once per route instead of scanning arguments per request
+        user_index = _find_current_user_index(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # Find current_user in the function arguments
-            current_user = None
-
-            # Check kwargs first (named parameters)
-            if "current_user" in kwargs:
-                current_user = kwargs["current_user"]
-            else:
-                # Check positional arguments (look for User instances)
-                for arg in args:
-                    if isinstance(arg, User):
-                        current_user = arg
-                        break
+            # FastAPI passes dependencies as keyword arguments
+            current_user = kwargs.get("current_user")
+            if (
+                current_user is None
+                and user_index is not None
+                and user_index < len(args)
+            ):
+                current_user = args[user_index]
 
             if not current_user:
                 raise HTTPException(
@@ -49,11 +73,10 @@ def require_roles(required_roles: List[RoleType]):
                 )
 
             # Check if user has any of the required roles
-            user_roles = {role.name for role in current_user.roles}
-            if not any(role.value in user_roles for role in required_roles):
+            if required_role_names.isdisjoint(current_user.role_names):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Required roles: {[role.value for role in required_roles]}",
+                    detail=required_roles_detail,
                 )
 
             return await func(*args, **kwargs)
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
@@ -11,8 +11,9 @@ if DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace(
         "postgresql://", "postgresql+psycopg://", 1)
 
-# Database engine configuration
-engine_kwargs = {}
+# Database engine configuration; the larger compiled-statement cache keeps
+# every ORM query shape cached instead of recompiling on eviction
+engine_kwargs = {"query_cache_size": 1200}
 
 if "sqlite" in DATABASE_URL:
     # SQLite specific settings
@@ -20,8 +21,34 @@ if "sqlite" in DATABASE_URL:
 elif "postgresql" in DATABASE_URL:
     # PostgreSQL specific settings
     engine_kwargs["pool_pre_ping"] = True
-    engine_kwargs["pool_recycle"] = 300
+    engine_kwargs["pool_size"] = settings.DB_POOL_SIZE
+    engine_kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+    engine_kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE
+    engine_kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
+    # Reuse the most recently returned connection so idle ones can expire
+    engine_kwargs["pool_use_lifo"] = True
+    engine_kwargs["connect_args"] = {
+        # Promote repeated queries to server-side prepared statements
+        # (None disables them, as PgBouncer transaction pooling requires)
+        "prepare_threshold": settings.DB_PREPARE_THRESHOLD or None,
+        # Short OLTP queries never benefit from JIT compilation
+        "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS} -c jit=off",
+    }
 
 engine = create_engine(DATABASE_URL, **engine_kwargs)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if "sqlite" in DATABASE_URL:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Enable WAL so readers do not block on concurrent writes."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+# Objects keep their loaded state after commit, so services can return them
+# without reloading every column; server-side defaults load on first access
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
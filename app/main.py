@@ -1,9 +1,24 @@
 import logging
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from app.core.config import settings, setup_logging
 from app.api.v1.api import api_router
+from app.db.session import engine
+from app.ai.nodes.shared import close_shared_http_client
+from app.ai.nodes.whatsapp_sender import close_whatsapp_sender
+from app.ai.services.checkpointer_service import get_checkpointer_service
+from app.ai.services.shared_pool_service import close_shared_pool, warmup_shared_pool
+from app.ai.workflows.chat_workflow import create_chat_workflow
+from app.services.webhook_queue_service import (
+    get_webhook_queue_stats,
+    start_webhook_workers,
+    stop_webhook_workers,
+)
 
 
 # Setup logging
@@ -11,6 +26,54 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
+    logger.info(f"Environment: {settings.ENVIRONMENT}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info(f"Log level: {settings.LOG_LEVEL}")
+
+    # The DB layer is sync SQLAlchemy, so request concurrency is bounded by
+    # the threadpool rather than the event loop (anyio defaults to 40)
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+    # Open the checkpointer pool and create its tables before serving requests
+    checkpointer_ready = False
+    if settings.DATABASE_URL:
+        try:
+            await warmup_shared_pool()
+            checkpointer_service = get_checkpointer_service()
+            checkpointer = await checkpointer_service.create_checkpointer(
+                async_mode=True, setup_timeout=30.0
+            )
+            checkpointer_ready = (
+                checkpointer_service.get_checkpointer_type(checkpointer) == "PostgreSQL"
+            )
+            if not checkpointer_ready:
+                logger.error(
+                    "Checkpointer warmup fell back to memory, continuing lazily"
+                )
+        except Exception as e:
+            logger.error(f"Checkpointer warmup failed, continuing lazily: {e}")
+
+    # Compile the chat graph once so requests get it without awaiting; skipped
+    # when warmup failed so it is not compiled against a fallback checkpointer
+    if checkpointer_ready:
+        try:
+            await create_chat_workflow(async_mode=True)
+        except Exception as e:
+            logger.error(f"Chat workflow warmup failed, continuing lazily: {e}")
+
+    start_webhook_workers()
+
+    yield
+
+    await stop_webhook_workers()
+    await close_whatsapp_sender()
+    await close_shared_http_client()
+    await close_shared_pool()
+
+
 def create_application() -> FastAPI:
     """
     Create and configure FastAPI application
@@ -23,6 +86,8 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Set up CORS
@@ -38,13 +103,6 @@ def create_application() -> FastAPI:
     # Include API router
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
-    @app.on_event("startup")
-    async def startup_event():
-        logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-        logger.info(f"Environment: {settings.ENVIRONMENT}")
-        logger.info(f"Debug mode: {settings.DEBUG}")
-        logger.info(f"Log level: {settings.LOG_LEVEL}")
-
     @app.get("/")
     async def root():
         return {
@@ -55,7 +113,18 @@ def create_application() -> FastAPI:
 
     @app.get("/health")
     async def health_check():
-        return {"status": "healthy"}
+        return {"status": "healthy", "webhook_queue": get_webhook_queue_stats()}
+
+    @app.get("/ready")
+    def readiness_check():
+        # Sync so the check runs in the threadpool, like other DB work
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.error(f"Readiness check failed: {e}")
+            return ORJSONResponse(status_code=503, content={"status": "unavailable"})
+        return {"status": "ready"}
 
     return app
 
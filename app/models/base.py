@@ -1,15 +1,54 @@
-from uuid import uuid4
 from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
+from sqlalchemy.sql.functions import FunctionElement
 from app.db.base_class import Base
 
 
+class gen_random_uuid(FunctionElement):
+    """Server-side random UUID, so inserts don't generate ids in Python."""
+
+    name = "gen_random_uuid"
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid)
+def _compile_gen_random_uuid(element, compiler, **kw):
+    return "gen_random_uuid()"
+
+
+@compiles(gen_random_uuid, "sqlite")
+def _compile_gen_random_uuid_sqlite(element, compiler, **kw):
+    # Same 32-character hex format SQLAlchemy stores UUIDs in on SQLite
+    return "(lower(hex(randomblob(16))))"
+
+
+class utc_now(FunctionElement):
+    """Server-side current UTC time, for naive UTC DateTime columns."""
+
+    name = "utc_now"
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _compile_utc_now(element, compiler, **kw):
+    # now() follows the session time zone; pin it to UTC
+    return "timezone('utc', now())"
+
+
+@compiles(utc_now, "sqlite")
+def _compile_utc_now_sqlite(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
 class BaseModel(Base):
     __abstract__ = True
 
+    # The primary key constraint already provides the unique index on id
     id = Column(UUID(as_uuid=True), primary_key=True,
-                default=uuid4, index=True)
+                server_default=gen_random_uuid())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True),
-                        server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+                        server_default=func.now(), onupdate=func.now())
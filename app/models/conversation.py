@@ -5,10 +5,25 @@ This model stores conversation metadata only. LangGraph's PostgreSQL checkpointe
 handles the actual message persistence automatically using thread_id.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, Boolean
-from datetime import datetime
+import time
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Index, text
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, utc_now
+
+# Last formatted thread id timestamp as (epoch second, "%Y%m%d_%H%M%S" label)
+_thread_id_timestamp = (0, "")
+
+
+def _thread_id_timestamp_label() -> str:
+    """Format the current UTC second, reusing the label within the same second."""
+    global _thread_id_timestamp
+
+    now = int(time.time())
+    second, label = _thread_id_timestamp
+    if second != now:
+        label = time.strftime("%Y%m%d_%H%M%S", time.gmtime(now))
+        _thread_id_timestamp = (now, label)
+    return label
 
 
 class Conversation(BaseModel):
@@ -20,6 +35,17 @@ class Conversation(BaseModel):
     """
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # At most one active conversation per sender; also serves the
+        # active conversation lookup on every inbound message
+        Index(
+            "ix_conversations_active_sender_id",
+            "sender_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     # Core identification
     sender_id = Column(String(255), nullable=False, index=True)
@@ -35,7 +61,7 @@ class Conversation(BaseModel):
 
     # Statistics (for business logic)
     message_count = Column(Integer, default=0)  # Track conversation length
-    last_message_at = Column(DateTime, default=datetime.utcnow)  # For sorting/cleanup
+    last_message_at = Column(DateTime, server_default=utc_now())  # For sorting/cleanup
 
     # Status management
     is_active = Column(Boolean, default=True)  # For archiving conversations
@@ -51,5 +77,4 @@ class Conversation(BaseModel):
         Format: user_{sender_id}_{timestamp}
         This ensures thread isolation per user.
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        return f"user_{sender_id}_{timestamp}"
+        return f"user_{sender_id}_{_thread_id_timestamp_label()}"
@@ -1,8 +1,14 @@
+from functools import cached_property
+from typing import FrozenSet
 from sqlalchemy import Boolean, Column, String
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm import relationship
 import bcrypt
+from app.core.config import settings
 from app.models.base import BaseModel
 
+# Role names that grant admin rights
+_ADMIN_ROLES = frozenset({"ADMIN", "SUPER_ADMIN"})
+
 
 class User(BaseModel):
     __tablename__ = "users"
@@ -22,20 +28,30 @@ class User(BaseModel):
         secondary="user_roles",
         back_populates="users",
         overlaps="user_roles",  # Tell SQLAlchemy this relationship overlaps with user_roles
+        lazy="selectin",  # Batch-load roles for every queried user in one SELECT
     )
-    
-    @validates("password")
-    def validate_password(self, key, password):
+
+    @cached_property
+    def role_names(self) -> FrozenSet[str]:
+        """
+        Names of the user's roles, computed once per instance.
+
+        Role changes made on this same instance are not reflected; users are
+        loaded fresh (or merged from the cache) for each request.
+        """
+        return frozenset(role.name for role in self.roles)
+
+    @staticmethod
+    def hash_password(password: str) -> str:
         """
-        Automatically hash password when it's set or updated.
-        This ensures passwords are never stored in plain text.
+        Hash a plain text password with the configured bcrypt cost.
+
+        Hashing is deliberately slow, so callers serving requests should run
+        it in a worker thread rather than on the event loop.
         """
-        if password and not password.startswith("$2b$"):  # Check if already hashed
-            pwd_bytes = password.encode("utf-8")
-            salt = bcrypt.gensalt()
-            hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
-            return hashed_password.decode("utf-8")
-        return password
+        pwd_bytes = password.encode("utf-8")
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        return bcrypt.hashpw(password=pwd_bytes, salt=salt).decode("utf-8")
 
     def verify_password(self, plain_password: str) -> bool:
         """
@@ -51,18 +67,28 @@ class User(BaseModel):
             password=password_byte_enc, hashed_password=hashed_password
         )
 
+    def password_needs_rehash(self) -> bool:
+        """
+        Check whether the stored hash uses fewer bcrypt rounds than configured.
+        """
+        try:
+            rounds = int(self.password.split("$")[2])
+        except (AttributeError, IndexError, ValueError):
+            return False
+        return rounds < settings.BCRYPT_ROUNDS
+
     def has_role(self, role_name: str) -> bool:
         """Check if user has a specific role."""
-        return any(role.name == role_name for role in self.roles)
+        return role_name in self.role_names
 
     def is_admin(self) -> bool:
         """Check if user is an admin or super admin."""
-        return any(role.name in ["ADMIN", "SUPER_ADMIN"] for role in self.roles)
+        return not self.role_names.isdisjoint(_ADMIN_ROLES)
 
     def is_staff(self) -> bool:
         """Check if user is staff (has STAFF role)."""
-        return any(role.name == "STAFF" for role in self.roles)
+        return "STAFF" in self.role_names
 
     def is_super_admin(self) -> bool:
         """Check if user is a super admin."""
-        return any(role.name == "SUPER_ADMIN" for role in self.roles)
+        return "SUPER_ADMIN" in self.role_names
@@ -1,5 +1,5 @@
 from uuid import UUID
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -7,12 +7,19 @@ from app.models.base import BaseModel
 
 class UserRole(BaseModel):
     __tablename__ = "user_roles"
+    __table_args__ = (
+        # One row per user/role pair; also serves user_id lookups when loading roles
+        Index("ix_user_roles_user_id_role_id", "user_id", "role_id", unique=True),
+    )
 
     user_id: UUID = Column(
         PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     role_id: UUID = Column(
-        PGUUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False
+        PGUUID(as_uuid=True),
+        ForeignKey("roles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,  # Role.users lookups and cascading role deletes
     )
 
     # Relationships with overlaps parameter to handle the many-to-many relationship
@@ -1,9 +1,13 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 from typing import Optional, List
-import re
+import string
 from uuid import UUID
 from app.models.role import RoleType
 
+# Character classes checked by UserRegister.validate_password
+_LETTERS = frozenset(string.ascii_letters)
+_SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 
 class Token(BaseModel):
     access_token: str
@@ -11,12 +15,6 @@ class Token(BaseModel):
     roles: List[str]
 
 
-class TokenData(BaseModel):
-    sub: str  # This will store the user ID
-    exp: int  # This will store the expiration timestamp
-    roles: List[str] = []
-
-
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -40,13 +38,23 @@ class UserRegister(BaseModel):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
-        if not re.search(r"[a-zA-Z]", v):
+        # Single pass over the password collecting the classes present
+        has_letter = has_digit = has_special = False
+        for ch in v:
+            if ch in _LETTERS:
+                has_letter = True
+            elif ch.isdecimal():
+                has_digit = True
+            elif ch in _SPECIAL_CHARACTERS:
+                has_special = True
+
+        if not has_letter:
             raise ValueError("Password must contain at least one letter")
 
-        if not re.search(r"\d", v):
+        if not has_digit:
             raise ValueError("Password must contain at least one number")
 
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not has_special:
             raise ValueError(
                 "Password must contain at least one special character")
 
@@ -58,8 +66,7 @@ class RoleResponse(BaseModel):
     name: RoleType
     description: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserResponse(BaseModel):
@@ -68,8 +75,7 @@ class UserResponse(BaseModel):
     is_active: bool
     roles: List[RoleResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AuthResponse(BaseModel):
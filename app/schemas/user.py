@@ -1,6 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from app.schemas.auth import RoleResponse, RoleType
 
 
@@ -22,8 +22,7 @@ class UserUpdate(BaseModel):
 class UserInDBBase(UserBase):
     id: UUID
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class User(UserInDBBase):
@@ -1,13 +1,36 @@
+import threading
+import time
 from datetime import timedelta, datetime
-from typing import Annotated, Optional
-from sqlalchemy.orm import Session
+from hashlib import blake2b
+from typing import Annotated, NamedTuple, Optional, Tuple
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 from fastapi import Depends
 from app.db.dependencies import get_db
 from jose import JWTError, jwt
 from app.core.config import settings
 from app.models.role import RoleType
 from app.models.user import User
-from app.schemas.auth import TokenData
+
+
+class TokenClaims(NamedTuple):
+    """
+    Claims of a verified access token.
+
+    Built straight from the signature-checked payload on the per-request auth
+    path.
+    """
+
+    sub: str
+    exp: int
+    roles: Tuple[str, ...]
+
+
+# Decoded tokens keyed by a digest of the raw token, so a bearer token reused
+# across requests is only signature-checked once a minute
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
 
 
 class AuthService:
@@ -39,18 +62,21 @@ class AuthService:
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
         return encoded_jwt
 
-    def verify_token(self, token: str) -> Optional[TokenData]:
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            token_data = TokenData(**payload)
-            return token_data
-        except JWTError:
-            return None
+    def verify_token(self, token: str) -> Optional[TokenClaims]:
+        return decode_access_token(token)
 
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
-        user = self.db.query(User).filter(User.email == email).first()
+        user = self.db.execute(
+            select(User).options(selectinload(User.roles)).where(User.email == email)
+        ).scalar_one_or_none()
         if not user or not user.verify_password(password):
             return None
+
+        # Upgrade hashes made with an older, cheaper cost factor
+        if user.password_needs_rehash():
+            user.password = User.hash_password(password)
+            self.db.commit()
+
         return user
 
     def has_role(self, user: User, role: RoleType) -> bool:
@@ -61,3 +87,33 @@ class AuthService:
 
     def is_super_admin(self, user: User) -> bool:
         return user.is_super_admin()
+
+
+def decode_access_token(token: str) -> Optional[TokenClaims]:
+    """
+    Verify and decode an access token, caching the result briefly.
+
+    Args:
+        token: Raw bearer token
+
+    Returns:
+        Decoded token data, or None if the token is invalid or expired
+    """
+    key = blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        token_data = _token_cache.get(key)
+    if token_data is not None:
+        # The cache TTL may outlive the token itself
+        return token_data if token_data.exp > time.time() else None
+
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        token_data = TokenClaims(
+            str(payload["sub"]), int(payload["exp"]), tuple(payload.get("roles", ()))
+        )
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+    with _token_cache_lock:
+        _token_cache[key] = token_data
+    return token_data
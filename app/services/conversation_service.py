@@ -1,14 +1,78 @@
-from datetime import datetime
 import logging
-from typing import Annotated, Optional
+import threading
+from typing import Annotated, Dict, Optional
 from uuid import UUID
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from fastapi import Depends, HTTPException, status
 from app.db.dependencies import get_db
+from app.models.base import utc_now
 from app.models.conversation import Conversation
 
 logger = logging.getLogger(__name__)
 
+# Active conversation id per sender, so inbound messages resolve their
+# conversation with a primary key lookup instead of the sender_id query.
+# Entries are verified on use, so a stale id only costs the fallback query.
+_active_conversation_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_active_conversation_lock = threading.Lock()
+
+# Lookup statements built once; identical statement objects hit the engine's
+# compiled-SQL cache without rebuilding the ORM expression on every call
+_ACTIVE_CONVERSATION_STMT = select(Conversation).where(
+    Conversation.sender_id == bindparam("sender_id"),
+    Conversation.is_active.is_(True),
+)
+_CONVERSATION_BY_ID_STMT = select(Conversation).where(
+    Conversation.id == bindparam("conversation_id")
+)
+
+# Message count deltas waiting to be written, per conversation id. Flushed in
+# one batch by ConversationService.flush_pending_metadata() instead of once
+# per message.
+_pending_metadata: Dict[UUID, int] = {}
+_pending_metadata_lock = threading.Lock()
+
+_conversations = Conversation.__table__
+_FLUSH_METADATA_STMT = (
+    update(_conversations)
+    .where(_conversations.c.id == bindparam("b_id"))
+    .values(
+        message_count=_conversations.c.message_count + bindparam("b_delta"),
+        # Stamped by the database, the same clock as the column default
+        last_message_at=utc_now(),
+    )
+)
+
+
+def record_conversation_activity(
+    conversation_id: UUID, message_count_increment: int = 2
+):
+    """
+    Queue a metadata update for a conversation after a message exchange.
+
+    Counts are only added up in memory here; they reach the database, along
+    with last_message_at, on the next ConversationService.flush_pending_metadata()
+    call.
+
+    Args:
+        conversation_id: Conversation UUID
+        message_count_increment: Number to increment message count by
+    """
+    with _pending_metadata_lock:
+        _pending_metadata[conversation_id] = (
+            _pending_metadata.get(conversation_id, 0) + message_count_increment
+        )
+
+
+def _dialect_insert(db: Session):
+    """Get the INSERT construct for the session's dialect (for ON CONFLICT)."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
 
 class ConversationService:
     """
@@ -48,41 +112,64 @@ class ConversationService:
                     detail="Sender not found or access denied",
                 )
 
+            # Fast path: the sender's cached active conversation
+            with _active_conversation_lock:
+                cached_id = _active_conversation_cache.get(sender_id)
+            if cached_id is not None:
+                cached_conversation = self.db.get(Conversation, cached_id)
+                if (
+                    cached_conversation is not None
+                    and cached_conversation.is_active
+                    and cached_conversation.sender_id == sender_id
+                ):
+                    return cached_conversation
+                with _active_conversation_lock:
+                    _active_conversation_cache.pop(sender_id, None)
+
             # Look for active conversation for this sender
-            existing_conversation = (
-                self.db.query(Conversation)
-                .filter(
-                    Conversation.sender_id == sender_id,
-                    Conversation.is_active == True,
-                )
-                .first()
-            )
+            existing_conversation = self._get_active_conversation(sender_id)
 
             if existing_conversation:
                 logger.info(
                     f"[CONVERSATION_SERVICE] Using existing conversation {existing_conversation.id}"
                 )
+                with _active_conversation_lock:
+                    _active_conversation_cache[sender_id] = existing_conversation.id
                 return existing_conversation
 
-            # Create new conversation with unique thread ID
-            conversation = Conversation(
-                sender_id=sender_id,
-                thread_id=Conversation.generate_thread_id(
-                    sender_id
-                ),  # Unique thread ID for LangGraph
-                title=title or f"Chat - {sender_id}",
-                message_count=0,
-                last_message_at=datetime.utcnow(),
-                is_active=True,
-            )
-
-            self.db.add(conversation)
+            # Create new conversation with unique thread ID. If a concurrent
+            # request created one first, the partial unique index on active
+            # conversations turns this into a no-op and its row is used instead
+            conversation = self.db.execute(
+                _dialect_insert(self.db)(Conversation)
+                .values(
+                    sender_id=sender_id,
+                    thread_id=Conversation.generate_thread_id(
+                        sender_id
+                    ),  # Unique thread ID for LangGraph
+                    title=title or f"Chat - {sender_id}",
+                    message_count=0,
+                    is_active=True,
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[Conversation.sender_id],
+                    index_where=Conversation.is_active,
+                )
+                .returning(Conversation)
+            ).scalar_one_or_none()
             self.db.commit()
-            self.db.refresh(conversation)
 
-            logger.info(
-                f"[CONVERSATION_SERVICE] Created new conversation {conversation.id}"
-            )
+            if conversation is None:
+                conversation = self._get_active_conversation(sender_id)
+                logger.info(
+                    f"[CONVERSATION_SERVICE] Using concurrently created conversation {conversation.id}"
+                )
+            else:
+                logger.info(
+                    f"[CONVERSATION_SERVICE] Created new conversation {conversation.id}"
+                )
+            with _active_conversation_lock:
+                _active_conversation_cache[sender_id] = conversation.id
 
             return conversation
 
@@ -98,59 +185,52 @@ class ConversationService:
                 detail="Failed to create conversation",
             )
 
-    def update_conversation_metadata(
-        self,
-        conversation_id: UUID,
-        sender_id: str,
-        message_count_increment: int = 2,  # User message + AI response
-        update_last_message: bool = True,
-    ) -> Conversation:
-        """
-        Update conversation metadata after message exchange.
+    def _get_active_conversation(self, sender_id: str) -> Optional[Conversation]:
+        """Get the sender's active conversation, if any."""
+        return self.db.execute(
+            _ACTIVE_CONVERSATION_STMT, {"sender_id": sender_id}
+        ).scalar_one_or_none()
 
-        Args:
-            conversation_id: Conversation UUID
-            sender_id: Sender ID
-            message_count_increment: Number to increment message count by
-            update_last_message: Whether to update last_message_at timestamp
+    def flush_pending_metadata(self) -> int:
+        """
+        Write all queued conversation metadata updates in one batch.
 
         Returns:
-            Updated conversation object
+            Number of conversations updated
 
         Raises:
-            HTTPException: If conversation not found or access denied
+            Exception: If the update fails; the queued updates are kept so
+                the next flush retries them
         """
-        # Get conversation directly without passing user object
-        conversation = (
-            self.db.query(Conversation)
-            .filter(Conversation.id == conversation_id)
-            .first()
-        )
+        global _pending_metadata
 
-        if not conversation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
-            )
+        with _pending_metadata_lock:
+            pending, _pending_metadata = _pending_metadata, {}
+        if not pending:
+            return 0
 
-        # Check if sender owns the conversation using sender_id
-        if conversation.sender_id != sender_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this conversation",
+        try:
+            self.db.execute(
+                _FLUSH_METADATA_STMT,
+                [
+                    {"b_id": conversation_id, "b_delta": delta}
+                    for conversation_id, delta in pending.items()
+                ],
             )
-
-        # Update metadata
-        conversation.message_count += message_count_increment
-        if update_last_message:
-            conversation.last_message_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(conversation)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            with _pending_metadata_lock:
+                for conversation_id, delta in pending.items():
+                    _pending_metadata[conversation_id] = (
+                        _pending_metadata.get(conversation_id, 0) + delta
+                    )
+            raise
 
         logger.info(
-            f"[CONVERSATION_SERVICE] Updated conversation {conversation_id} metadata"
+            f"[CONVERSATION_SERVICE] Flushed metadata for {len(pending)} conversations"
         )
-        return conversation
+        return len(pending)
 
     def get_conversation(
         self,
@@ -170,11 +250,9 @@ class ConversationService:
         Raises:
             HTTPException: If user doesn't have permission to access the conversation
         """
-        conversation = (
-            self.db.query(Conversation)
-            .filter(Conversation.id == conversation_id)
-            .first()
-        )
+        conversation = self.db.execute(
+            _CONVERSATION_BY_ID_STMT, {"conversation_id": conversation_id}
+        ).scalar_one_or_none()
 
         if not conversation:
             return None
@@ -206,12 +284,24 @@ class ConversationService:
         Raises:
             HTTPException: If user doesn't have permission to deactivate the conversation
         """
-        conversation = self.get_conversation(conversation_id, sender_id)
-        if not conversation:
+        result = self.db.execute(
+            update(Conversation)
+            .where(
+                Conversation.id == conversation_id,
+                Conversation.sender_id == sender_id,
+            )
+            .values(is_active=False)
+        )
+
+        if result.rowcount == 0:
+            self.db.rollback()
+            # Raises 403 if the conversation exists but belongs to another sender
+            self.get_conversation(conversation_id, sender_id)
             return False
 
-        conversation.is_active = False
         self.db.commit()
+        with _active_conversation_lock:
+            _active_conversation_cache.pop(sender_id, None)
 
         logger.info(
             f"[CONVERSATION_SERVICE] Deactivated conversation {conversation_id}")
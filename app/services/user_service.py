@@ -1,5 +1,8 @@
+import threading
 from typing import Annotated, Optional, List
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 from fastapi import Depends, HTTPException, status
 from app.db.dependencies import get_db
 from app.models.role import Role, RoleType
@@ -8,6 +11,52 @@ from app.schemas.user import UserCreate, UserUpdate
 from app.core.guards.authorization_guard import AuthGuardDep
 from app.services.auth_service import AuthService
 
+# Detached users (with roles loaded) keyed by id, for the per-request auth lookup.
+# Invalidation only reaches the local process, so the TTL is kept short to bound
+# how long other workers can see a deactivated user or stale roles.
+_USER_CACHE_TTL_SECONDS = 15
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop a user from the lookup cache after it has been changed or deleted."""
+    with _user_cache_lock:
+        _user_cache.pop(str(user_id), None)
+
+
+def get_cached_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    Get a user by id, served from a short-lived cache on the auth hot path.
+
+    Cached users are kept detached from any session and merged into the
+    given one without a query, so callers get a session-bound instance.
+
+    Args:
+        db: Session to bind the returned user to
+        user_id: User id
+
+    Returns:
+        User with roles loaded, or None if not found
+    """
+    key = str(user_id)
+    with _user_cache_lock:
+        cached_user = _user_cache.get(key)
+    if cached_user is not None:
+        return db.merge(cached_user, load=False)
+
+    user = db.execute(
+        select(User).options(selectinload(User.roles)).where(User.id == user_id)
+    ).scalar_one_or_none()
+    if not user:
+        return None
+
+    # Keep the loaded instance as the pristine cached copy
+    db.expunge(user)
+    with _user_cache_lock:
+        _user_cache[key] = user
+    return db.merge(user, load=False)
+
 
 class UserService:
     def __init__(
@@ -21,32 +70,38 @@ class UserService:
         self.auth_guard = auth_guard
 
     def get_user_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.execute(
+            select(User).where(User.email == email)
+        ).scalar_one_or_none()
 
     def get_users(self, current_user: User, skip: int, limit: int) -> List[User]:
-        return self.db.query(User).offset(skip).limit(limit).all()
+        return (
+            self.db.query(User)
+            .options(selectinload(User.roles))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
-        return self.db.query(User).filter(User.id == user_id).first()
+        return get_cached_user(self.db, user_id)
 
     def create_user(self, user: UserCreate) -> User:
-        # Password will be automatically hashed by the model's @validates decorator
         db_user = User(
             email=user.email,
-            password=user.password,  # Will be automatically hashed
+            password=User.hash_password(user.password),
             is_active=user.is_active,
         )
 
         # Add roles if specified in UserCreate
         if user.roles:
-            for role_type in user.roles:
-                role = self.db.query(Role).filter(Role.name == role_type).first()
-                if role:
-                    db_user.roles.append(role)
+            roles = self.db.execute(
+                select(Role).where(Role.name.in_(user.roles))
+            ).scalars()
+            db_user.roles.extend(roles)
 
         self.db.add(db_user)
         self.db.commit()
-        self.db.refresh(db_user)
         return db_user
 
     def update_user(
@@ -65,11 +120,13 @@ class UserService:
             )
 
         update_data = user_update.dict(exclude_unset=True)
+        if update_data.get("password"):
+            update_data["password"] = User.hash_password(update_data["password"])
         for field, value in update_data.items():
             setattr(target_user, field, value)
 
         self.db.commit()
-        self.db.refresh(target_user)
+        invalidate_cached_user(target_user.id)
         return target_user
 
     def delete_user(self, user_id: str, current_user: User) -> bool:
@@ -79,10 +136,13 @@ class UserService:
 
         self.db.delete(target_user)
         self.db.commit()
+        invalidate_cached_user(target_user.id)
         return True
 
     def get_user(self, user_id: str, current_user: User) -> Optional[User]:
-        target_user = self.db.query(User).filter(User.id == user_id).first()
+        target_user = self.db.execute(
+            select(User).options(selectinload(User.roles)).where(User.id == user_id)
+        ).scalar_one_or_none()
         if not target_user:
             return None
 
@@ -121,7 +181,7 @@ class UserService:
         if role not in target_user.roles:
             target_user.roles.append(role)
             self.db.commit()
-            self.db.refresh(target_user)
+            invalidate_cached_user(target_user.id)
 
         return target_user
 
@@ -139,21 +199,18 @@ class UserService:
         if not target_user:
             return None
 
-        role = self.db.query(Role).filter(Role.name == role_type).first()
+        # The role to remove is already among the user's loaded roles
+        role = next(
+            (role for role in target_user.roles if role.name == role_type), None
+        )
         if not role:
-            raise HTTPException(
-                status_code=404, detail=f"Role {role_type.value} not found"
-            )
-
-        if not self.auth_service.has_role(target_user, role_type):
             raise HTTPException(
                 status_code=403, detail=f"User does not have role {role_type.value}"
             )
 
-        if role in target_user.roles:
-            target_user.roles.remove(role)
-            self.db.commit()
-            self.db.refresh(target_user)
+        target_user.roles.remove(role)
+        self.db.commit()
+        invalidate_cached_user(target_user.id)
 
         return target_user
 
@@ -0,0 +1,253 @@
+"""
+Webhook queue service for WhatsApp message processing.
+
+The webhook endpoint only validates and enqueues incoming messages so it can
+acknowledge Meta within its delivery timeout; a fixed set of background
+workers then runs the conversation lookup and the AI workflow for each
+message. Each worker owns its own queue and a sender always maps to the same
+one, so a sender's messages are processed one at a time and in order.
+Conversation metadata updates are batched and written periodically.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+from cachetools import TTLCache
+from app.ai.dependencies import get_chat_service
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.schemas.chat import Message
+from app.services.conversation_service import (
+    ConversationService,
+    record_conversation_activity,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-worker queues and worker tasks, created by start_webhook_workers()
+_message_queues: List[asyncio.Queue] = []
+_workers: List[asyncio.Task] = []
+_metadata_flush_task: Optional[asyncio.Task] = None
+
+# Ids of recently queued messages, so a webhook Meta redelivers for the same
+# message is acknowledged without running the workflow (and replying) again
+_DUPLICATE_WINDOW_SECONDS = 3600
+_recent_message_ids: TTLCache = TTLCache(maxsize=10_000, ttl=_DUPLICATE_WINDOW_SECONDS)
+
+# Seconds between batched conversation metadata writes
+_METADATA_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Counters reported by get_webhook_queue_stats()
+_stats: Dict[str, float] = {
+    "processed": 0,
+    "failed": 0,
+    "dropped": 0,
+    "duplicates": 0,
+    "last_latency_seconds": 0.0,
+}
+
+
+def start_webhook_workers():
+    """
+    Create one message queue per worker and start the background workers.
+
+    WEBHOOK_QUEUE_MAXSIZE is split evenly across the worker queues. Called once
+    from the application lifespan.
+    """
+    global _metadata_flush_task
+
+    if _workers:
+        return
+
+    queue_maxsize = max(1, settings.WEBHOOK_QUEUE_MAXSIZE // settings.WEBHOOK_WORKERS)
+    for index in range(settings.WEBHOOK_WORKERS):
+        queue = asyncio.Queue(maxsize=queue_maxsize)
+        _message_queues.append(queue)
+        _workers.append(
+            asyncio.create_task(_worker_loop(queue), name=f"webhook-{index}")
+        )
+    _metadata_flush_task = asyncio.create_task(
+        _metadata_flush_loop(), name="webhook-metadata-flush"
+    )
+
+    logger.info(
+        "[WEBHOOK_QUEUE_SERVICE] Started %d webhook workers (queue size %d)",
+        settings.WEBHOOK_WORKERS,
+        settings.WEBHOOK_QUEUE_MAXSIZE,
+    )
+
+
+async def stop_webhook_workers(timeout: float = 10.0):
+    """
+    Let the workers finish queued messages, then stop them and write any
+    pending conversation metadata.
+
+    Args:
+        timeout: Seconds to wait for the queue to drain before cancelling
+    """
+    global _metadata_flush_task
+
+    if not _workers:
+        return
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(queue.join() for queue in _message_queues)),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "[WEBHOOK_QUEUE_SERVICE] Stopping with %d unprocessed messages",
+            sum(queue.qsize() for queue in _message_queues),
+        )
+
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _message_queues.clear()
+
+    _metadata_flush_task.cancel()
+    await asyncio.gather(_metadata_flush_task, return_exceptions=True)
+    _metadata_flush_task = None
+    await _flush_metadata()
+    logger.info("[WEBHOOK_QUEUE_SERVICE] Stopped webhook workers")
+
+
+def enqueue_message(sender_id: str, message: Message) -> bool:
+    """
+    Queue an incoming message for background processing.
+
+    The message goes to the queue of the worker that owns its sender, so
+    messages from one sender never run concurrently on the same thread. When
+    that queue is full the message is dropped (and counted) rather than
+    delaying the webhook response. A message id already queued within the
+    duplicate window is skipped, since Meta redelivers webhooks it considers
+    unacknowledged.
+
+    Args:
+        sender_id: Sender phone number
+        message: Incoming WhatsApp message
+
+    Returns:
+        True if the message was queued, False if it was dropped or a duplicate
+    """
+    if not _message_queues:
+        logger.error("[WEBHOOK_QUEUE_SERVICE] Workers not started, dropping message")
+        _stats["dropped"] += 1
+        return False
+
+    if message.id in _recent_message_ids:
+        _stats["duplicates"] += 1
+        logger.info("[WEBHOOK_QUEUE_SERVICE] Skipping duplicate message %s", message.id)
+        return False
+
+    queue = _message_queues[hash(sender_id) % len(_message_queues)]
+    try:
+        queue.put_nowait((sender_id, message, time.monotonic()))
+    except asyncio.QueueFull:
+        _stats["dropped"] += 1
+        logger.warning(
+            "[WEBHOOK_QUEUE_SERVICE] Queue full, dropping message %s", message.id
+        )
+        return False
+
+    # Only queued messages count, so a dropped one is processed on redelivery
+    _recent_message_ids[message.id] = True
+    return True
+
+
+def get_webhook_queue_stats() -> Dict[str, float]:
+    """
+    Get webhook queue statistics for monitoring.
+
+    Returns:
+        Dict with queue depth, worker count and processing counters
+    """
+    return {
+        "queue_depth": sum(queue.qsize() for queue in _message_queues),
+        "workers": len(_workers),
+        **_stats,
+    }
+
+
+async def _worker_loop(queue: asyncio.Queue):
+    """Process queued messages one at a time until cancelled."""
+    while True:
+        sender_id, message, enqueued_at = await queue.get()
+        try:
+            await _process_message(sender_id, message)
+            _stats["processed"] += 1
+        except Exception as e:
+            _stats["failed"] += 1
+            logger.error(
+                "[WEBHOOK_QUEUE_SERVICE] Failed to process message %s: %s",
+                message.id,
+                e,
+            )
+        finally:
+            _stats["last_latency_seconds"] = time.monotonic() - enqueued_at
+            queue.task_done()
+
+
+async def _metadata_flush_loop():
+    """Write batched conversation metadata at a fixed interval until cancelled."""
+    while True:
+        await asyncio.sleep(_METADATA_FLUSH_INTERVAL_SECONDS)
+        await _flush_metadata()
+
+
+async def _flush_metadata():
+    """Write pending conversation metadata, logging rather than raising failures."""
+
+    def flush():
+        db = SessionLocal()
+        try:
+            ConversationService(db).flush_pending_metadata()
+        finally:
+            db.close()
+
+    try:
+        await asyncio.to_thread(flush)
+    except Exception as e:
+        logger.error(
+            "[WEBHOOK_QUEUE_SERVICE] Failed to flush conversation metadata: %s", e
+        )
+
+
+async def _process_message(sender_id: str, message: Message):
+    """
+    Run the conversation pipeline for a single message.
+
+    The conversation service uses sync SQLAlchemy, so its calls run in a
+    worker thread to keep the event loop free during the queries. The
+    metadata update is only queued here and written by the periodic flush.
+
+    Args:
+        sender_id: Sender phone number
+        message: Incoming WhatsApp message
+    """
+    db = SessionLocal()
+    try:
+        conversation_service = ConversationService(db)
+
+        # Step 1: Get or create conversation through business service
+        conversation = await asyncio.to_thread(
+            conversation_service.get_or_create_conversation,
+            sender_id=sender_id,
+        )
+
+        # Step 2: Send message through AI service
+        await get_chat_service().send_message(
+            message=message,
+            thread_id=conversation.thread_id,
+        )
+
+        # Step 3: Queue the conversation metadata update
+        record_conversation_activity(
+            conversation.id,
+            message_count_increment=2,  # User message + AI response
+        )
+    finally:
+        db.close()
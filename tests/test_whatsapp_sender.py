@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+from tenacity import wait_fixed
+
+from app.ai.nodes import whatsapp_sender
+
+_RETRYING_RECIPIENT = "15550000001"
+_HEALTHY_RECIPIENT = "15550000002"
+
+
+class _FakeClient:
+    """Graph API stand-in that fails every send to one recipient with a 503."""
+
+    def __init__(self):
+        self.attempts = {_RETRYING_RECIPIENT: 0, _HEALTHY_RECIPIENT: 0}
+
+    async def post(self, url, headers, content, timeout):
+        to = orjson.loads(content)["to"]
+        self.attempts[to] += 1
+        return httpx.Response(503 if to == _RETRYING_RECIPIENT else 200)
+
+
+def test_retrying_send_does_not_delay_other_recipients(monkeypatch):
+    client = _FakeClient()
+    monkeypatch.setattr(whatsapp_sender, "get_shared_http_client", lambda: client)
+    monkeypatch.setattr(whatsapp_sender._post_message.retry, "wait", wait_fixed(0.5))
+
+    async def scenario() -> float:
+        retrying = asyncio.create_task(
+            whatsapp_sender.send_text_message(_RETRYING_RECIPIENT, "hello")
+        )
+        # Send the next message only once the first one is backing off
+        while client.attempts[_RETRYING_RECIPIENT] == 0:
+            await asyncio.sleep(0.01)
+
+        start = time.monotonic()
+        await whatsapp_sender.send_text_message(_HEALTHY_RECIPIENT, "hello")
+        healthy_elapsed = time.monotonic() - start
+
+        with pytest.raises(whatsapp_sender._RetryableSendError):
+            await retrying
+        await whatsapp_sender.close_whatsapp_sender()
+        return healthy_elapsed
+
+    healthy_elapsed = asyncio.run(scenario())
+
+    # The retrying send backs off three times (1.5s); later sends must not wait
+    assert healthy_elapsed < 0.5
+    assert client.attempts[_RETRYING_RECIPIENT] == whatsapp_sender._MAX_SEND_ATTEMPTS
+    assert client.attempts[_HEALTHY_RECIPIENT] == 1